@@ -1,25 +1,42 @@
 import asyncio
-import yaml
+import os
 import inspect_ai
 from inspect_ai.solver import solver
 from inspect_ai.dataset._dataset import MemoryDataset, Sample
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from safety_governor.core import Orchestrator
+from safety_governor.core import Orchestrator, load_config
+
+# Seeds are CPU-bound Python, so they run in worker processes rather than threads
+_POOL = None
+# Per-worker orchestrators, built once per config file
+_ORCHESTRATORS = {}
+
+def _get_pool():
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _POOL
+
+def _run_seed_worker(config_path, seed):
+    """Run one seed in a worker process, reusing its orchestrator for the config."""
+    orch = _ORCHESTRATORS.get(config_path)
+    if orch is None:
+        orch = _ORCHESTRATORS[config_path] = Orchestrator(load_config(config_path))
+    return orch.run_seed(seed)
 
 @solver
 def run_env():
     async def solve(state, generate):
         seed = int(state.input_text)
         config_path = state.metadata.get("config")
-        with open(config_path) as f:
-            cfg = yaml.safe_load(f)
-        orch = Orchestrator(cfg)
-        result = await asyncio.to_thread(orch.run_seed, seed)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(_get_pool(), _run_seed_worker, config_path, seed)
         state.metadata["result"] = result
         state.completed = True
         return state
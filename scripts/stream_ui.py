@@ -1,29 +1,31 @@
-import yaml
 import streamlit as st
 import sys
+import time
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from safety_governor.core import Orchestrator
+from safety_governor.core import Orchestrator, load_config
 
 st.set_page_config(page_title="Safety-Governor Demo", layout="wide")
 st.title("Hierarchical Safety-Governor Demo")
 
+# Minimum time between redraws of the live step widgets, in seconds
+UPDATE_INTERVAL = 0.1
+
 cfg_path = st.sidebar.text_input("Config file", "configs/demo.yaml")
 run_btn = st.sidebar.button("Run Simulation")
 
 if run_btn:
-    with open(cfg_path) as f:
-        cfg = yaml.safe_load(f)
+    cfg = load_config(cfg_path)
     orch = Orchestrator(cfg)
     seeds = cfg["seeds"]
     if isinstance(seeds, str) and '-' in seeds:
         lo, hi = map(int, seeds.split('-'))
-        seeds_list = list(range(lo, hi + 1))
+        seeds_list = range(lo, hi + 1)
     elif isinstance(seeds, (list, range)):
-        seeds_list = list(seeds)
+        seeds_list = seeds
     else:
         seeds_list = [int(seeds)]
     
@@ -40,13 +42,25 @@ if run_btn:
             st.write("**Total Rewards**")
             rewards_placeholder = st.empty()
         
-        # Stream the simulation
+        # Stream the simulation. Every write ships a frame to the browser, so
+        # redraw at most every UPDATE_INTERVAL and always show the last step.
+        last_draw = 0.0
+        pending = None
         for event in orch.run_seed_stream(seed):
             if event['type'] == 'step':
-                actions_placeholder.write(event['actions'])
-                rewards_placeholder.write(event['total'])
+                now = time.monotonic()
+                if now - last_draw >= UPDATE_INTERVAL:
+                    actions_placeholder.write(event['actions'])
+                    rewards_placeholder.write(dict(event['total']))
+                    last_draw = now
+                    pending = None
+                else:
+                    pending = event
             elif event['type'] == 'summary':
-                st.success(f"Final rewards: {event['total']}")
+                if pending is not None:
+                    actions_placeholder.write(pending['actions'])
+                    rewards_placeholder.write(dict(pending['total']))
+                st.success(f"Final rewards: {dict(event['total'])}")
                 
 st.sidebar.markdown("---")
 st.sidebar.markdown("**About**")
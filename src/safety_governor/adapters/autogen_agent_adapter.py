@@ -1,27 +1,212 @@
 """Adapter: wraps an AutoGen Agent (or GroupChat) so orchestrator can call .act()"""
 from __future__ import annotations
-import asyncio, json, uuid, copy
-# import logging # Not needed as per instruction to use print()
-from typing import Any, Dict, Optional, Union
+import asyncio, json, logging, operator, os, random, sys, threading, uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 import autogen  # type: ignore
-from safety_governor.utils.llm_client import LLMClient
-from safety_governor.utils.prompt_templates import get_prompt_template, format_prompt
+from safety_governor.utils.aio import new_event_loop
+from safety_governor.utils.llm_client import FALLBACK_RESPONSE, get_client
+from safety_governor.utils.prompt_templates import GAME_TYPES, compile_prompt, get_prompt_template
+from safety_governor.utils.response_cache import ResponseCache
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional speedup, see the "perf" extra
+    orjson = None
+
+# orjson decodes in C and raises a JSONDecodeError subclass, so callers can
+# keep catching json.JSONDecodeError regardless of which backend is active.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+logger = logging.getLogger(__name__)
+
+# Threads for blocking LLM/chat calls, kept apart from asyncio's default
+# executor; SG_LLM_THREADS caps how many requests are in flight at once
+_LLM_THREADS = int(os.environ.get("SG_LLM_THREADS", 64))
+_llm_pool: Optional[ThreadPoolExecutor] = None
+_llm_pool_pid: Optional[int] = None
+_llm_pool_lock = threading.Lock()
+
+def llm_executor() -> ThreadPoolExecutor:
+    """Return the shared pool for blocking LLM calls, creating it on first use."""
+    global _llm_pool, _llm_pool_pid
+    # A pool inherited through fork has no live threads; build a fresh one
+    if _llm_pool is None or _llm_pool_pid != os.getpid():
+        with _llm_pool_lock:
+            if _llm_pool is None or _llm_pool_pid != os.getpid():
+                _llm_pool = ThreadPoolExecutor(max_workers=_LLM_THREADS, thread_name_prefix="llm-chat")
+                _llm_pool_pid = os.getpid()
+    return _llm_pool
+
+
+# Event loop reused by the synchronous act() path, one per calling thread
+_local = threading.local()
+
+def _thread_loop() -> asyncio.AbstractEventLoop:
+    """Return this thread's persistent event loop, creating it on first use."""
+    loop = getattr(_local, 'loop', None)
+    if loop is None or loop.is_closed():
+        loop = _local.loop = new_event_loop()
+    return loop
+
+
+def run_actions_batch(adapters: Sequence["AutoGenAgentAdapter"],
+                      observations: Sequence[Dict[str, Any]],
+                      infos: Optional[Sequence[Optional[Dict[str, Any]]]] = None) -> List[Any]:
+    """Act with several adapters at once from synchronous code.
+
+    All ``act_async`` calls run concurrently on the calling thread's
+    persistent loop, so their LLM requests overlap instead of running back to
+    back. Returns the actions in the order of ``adapters``.
+    """
+    if infos is None:
+        infos = [None] * len(adapters)
+
+    async def _gather():
+        return await asyncio.gather(*(a.act_async(o, i) for a, o, i in zip(adapters, observations, infos)))
+
+    return _thread_loop().run_until_complete(_gather())
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert numpy arrays/scalars to native Python types, leaving the rest by reference.
+
+    Dicts are only copied when one of their values actually changes, so
+    observations that are already plain Python are returned as-is.
+    """
+    if hasattr(value, 'tolist'):
+        # np.ndarray -> list, np.generic -> Python scalar
+        return value.tolist()
+    if isinstance(value, dict):
+        converted = None
+        for k, v in value.items():
+            new = _jsonable(v)
+            if new is not v:
+                if converted is None:
+                    converted = dict(value)
+                converted[k] = new
+        return value if converted is None else converted
+    return value
+
+
+def _parse_reply(reply: Any) -> Any:
+    """Decode the JSON payload of an LLM reply.
+
+    The payload is the span from the first '{' to the last '}', which tolerates
+    chatter the model adds around it. Each bound is located with a single scan
+    and sliced directly, without stripping or copying the whole reply first.
+    Replies without braces are decoded as-is (e.g. a bare integer).
+    """
+    if not isinstance(reply, (str, bytes, bytearray)):
+        reply = str(reply)
+    open_, close = ('{', '}') if isinstance(reply, str) else (b'{', b'}')
+    start = reply.find(open_)
+    end = reply.rfind(close) if start != -1 else -1
+    if end > start:
+        return _json_loads(reply[start:end + 1])
+    return _json_loads(reply)
+
+
+# Comparison operators allowed in 'conditional' mock behaviors
+_CONDITION_OPS = {
+    '==': operator.eq,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+}
+
+MockFn = Callable[[Dict[str, Any], Optional[Dict[str, Any]]], Dict[str, Any]]
+
+
+def _fixed_action(action: Any) -> MockFn:
+    return lambda observation, info: {"action": action}
+
+
+def _compile_condition(condition: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """Turn a {field, operator, value} condition into a predicate on observations."""
+    field = condition.get('field')
+    value = condition.get('value')
+    op = _CONDITION_OPS.get(condition.get('operator', '=='))
+    if op is None:
+        return lambda observation: False
+
+    def predicate(observation: Dict[str, Any]) -> bool:
+        return field in observation and op(observation[field], value)
+    return predicate
+
+
+def _compile_mock_behavior(behavior: Optional[Union[str, Dict[str, Any]]],
+                           rng: random.Random) -> MockFn:
+    """Resolve a mock behavior configuration into a function returning action dicts."""
+    if isinstance(behavior, str):
+        # Simple string behaviors
+        if behavior == "always_low":
+            return _fixed_action(0)
+        if behavior == "always_high":
+            return _fixed_action(9)
+        if behavior == "always_medium":
+            return _fixed_action(5)
+        if behavior == "random":
+            randint = rng.randint
+            return lambda observation, info: {"action": randint(0, 9)}
+        if behavior == "tit_for_tat":
+            # Mirror opponent's last action
+            return lambda observation, info: {"action": int(observation.get('opponent_last_price', 5))}
+        # Default if unknown behavior
+        return _fixed_action(0)
+    if isinstance(behavior, dict):
+        # Complex configurable behaviors
+        behavior_type = behavior.get('type', 'fixed')
+        if behavior_type == 'fixed':
+            return _fixed_action(behavior.get('action', 0))
+        if behavior_type == 'pattern':
+            # Cycle through a pattern of actions
+            pattern = tuple(behavior.get('pattern', [0]))
+            return lambda observation, info: {"action": pattern[observation.get('round_num', 0) % len(pattern)]}
+        if behavior_type == 'conditional':
+            # Conditional logic based on observation; first matching condition wins
+            rules = tuple((_compile_condition(c), c.get('action', 0))
+                          for c in behavior.get('conditions', []))
+            default_action = behavior.get('default_action', 0)
+
+            def conditional(observation: Dict[str, Any], info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+                for matches, action in rules:
+                    if matches(observation):
+                        return {"action": action}
+                return {"action": default_action}
+            return conditional
+    # Fallback
+    return _fixed_action(0)
+
 
 class AutoGenAgentAdapter:
+    # Parsed LLM actions shared by all adapters, keyed by endpoint, model and prompt.
+    # This is the only LLM cache; ``enable_cache`` switches it off per adapter.
+    _RESPONSE_CACHE = ResponseCache(maxsize=4096)
+
     def __init__(self, autogen_agent: Union[autogen.Agent, autogen.GroupChat],
                  name: Optional[str] = None, system_prompt: Optional[str] = None,
                  llm_config: Optional[Dict[str, Any]] = None,
                  prompt_template: Optional[str] = None,
                  game_type: Optional[str] = "price_game",
                  agent_index: int = 0,
-                 mock_behavior: Optional[Union[str, Dict[str, Any]]] = None):
+                 mock_behavior: Optional[Union[str, Dict[str, Any]]] = None,
+                 enable_cache: bool = True,
+                 inject_info: Optional[Dict[str, Any]] = None):
         self.agent = autogen_agent
         self.name = name or getattr(autogen_agent, 'name', f"agent_{uuid.uuid4().hex[:6]}")
         self.llm_client = None
         self.agent_index = agent_index
+        # Private RNG so agents neither share nor contend for the global one
+        self._rng = random.Random()
         self.mock_behavior = mock_behavior
+        self.enable_cache = enable_cache
+        # Extra entries merged into each step's info (e.g. {"predicted_opponent_price": "low"})
+        self.inject_info = inject_info
         
         # Set prompt template - priority: custom > game_type default > price_game default
+        # (a custom template may also just name a built-in game type)
         if prompt_template:
             self.prompt_template = prompt_template
         else:
@@ -29,155 +214,180 @@ class AutoGenAgentAdapter:
             
         # Initialize LLM client if llm_config is provided
         if llm_config and isinstance(llm_config, dict):
-            self.llm_client = LLMClient(llm_config)
-            print(f"AGENT [{self.name}] - Initialized with LLM config: {llm_config}")
+            # Agents with identical settings share one client and its connection pool
+            self.llm_client = get_client(llm_config)
+            # Only log non-secret fields; llm_config may carry an api_key
+            logger.info("AGENT [%s] - Initialized with LLM provider=%s model=%s",
+                        self.name, self.llm_client.provider, self.llm_client.model)
         
+        # The chat dispatch path never changes for an adapter; resolve it once
+        self._chat = getattr(self.agent, 'chat', None)
+        self._chat_is_async = asyncio.iscoroutinefunction(self._chat)
+
         if system_prompt:
             self.agent.send(system_prompt, recipient=self.agent, request_reply=False)
 
+    @property
+    def prompt_template(self) -> str:
+        return self._prompt_template
+
+    @prompt_template.setter
+    def prompt_template(self, template: str) -> None:
+        # Resolve and pre-parse once here instead of on every act_async call
+        if template in GAME_TYPES:
+            template = get_prompt_template(template)
+        elif isinstance(template, str):
+            # Agents configured with the same custom text share one string object
+            template = sys.intern(template)
+        self._prompt_template = template
+        self._format_prompt = compile_prompt(template)
+
     async def act_async(self, observation: Dict[str, Any],
                         info: Optional[Dict[str, Any]] = None) -> Any:
         try:
-            original_info_for_logging = info.copy() if info is not None else None
-            if info is None:
-                info = {}
-            info["predicted_opponent_price"] = "low"
-
-            print(f"AGENT [{self.name}] - Observation: {observation}")
-            print(f"AGENT [{self.name}] - Original Info: {original_info_for_logging}")
-            print(f"AGENT [{self.name}] - Manipulated Info: {info}")
+            # Per-step logging formats whole observations; skip it entirely unless enabled
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("AGENT [%s] - Observation: %s", self.name, observation)
+            if self.inject_info:
+                if debug:
+                    logger.debug("AGENT [%s] - Original Info: %s", self.name, info)
+                info = {**info, **self.inject_info} if info else dict(self.inject_info)
+                if debug:
+                    logger.debug("AGENT [%s] - Manipulated Info: %s", self.name, info)
 
             # Convert numpy arrays in observation to lists for JSON serialization
-            observation_for_json = copy.deepcopy(observation)
-            for key, value in observation_for_json.items():
-                if hasattr(value, 'tolist'):
-                    observation_for_json[key] = value.tolist()
+            observation_for_json = _jsonable(observation)
 
             # Format the prompt using the template and observation
-            formatted_prompt = format_prompt(self.prompt_template, observation_for_json, self.agent_index)
+            formatted_prompt = self._format_prompt(observation_for_json, self.agent_index)
 
-            print(f"AGENT [{self.name}] - Has LLM: {self.llm_client is not None}, Has Mock Behavior: {hasattr(self, 'mock_behavior') and self.mock_behavior is not None}")
+            if debug:
+                logger.debug("AGENT [%s] - Has LLM: %s, Has Mock Behavior: %s", self.name,
+                             self.llm_client is not None,
+                             self.mock_behavior is not None)
             
+            action_dict = None
+            cache_key = None
             if self.llm_client:
+                if self._cache_enabled():
+                    client = self.llm_client
+                    cache_key = ResponseCache.make_key(client.provider, client.model,
+                                                       getattr(client, 'api_base', None),
+                                                       getattr(client, 'max_tokens', None),
+                                                       formatted_prompt)
+                    cached = self._RESPONSE_CACHE.get(cache_key)
+                    if cached is not None:
+                        logger.debug("AGENT [%s] - Cached Action: %s", self.name, cached)
+                        return cached
+
                 # Use our LLM client for generation
-                print(f"AGENT [{self.name}] - Calling LLM with prompt length: {len(formatted_prompt)}")
-                reply = self.llm_client.generate(formatted_prompt)
-                print(f"AGENT [{self.name}] - LLM Response: {reply}")
-            elif hasattr(self, 'mock_behavior') and self.mock_behavior is not None:
+                logger.debug("AGENT [%s] - Calling LLM with prompt length: %d", self.name, len(formatted_prompt))
+                reply = await self._generate(formatted_prompt)
+                logger.debug("AGENT [%s] - LLM Response: %s", self.name, reply)
+                if reply == FALLBACK_RESPONSE:
+                    cache_key = None  # Don't remember failed requests
+                elif not isinstance(reply, (str, bytes, bytearray)):
+                    action_dict = reply  # Already decoded by generate_json
+            elif self.mock_behavior is not None:
                 # Use configurable mock behavior
-                reply_content = self._get_mock_action(observation, info)
-                reply = json.dumps(reply_content)
-                print(f"AGENT [{self.name}] - Using mock behavior: {self.mock_behavior}")
+                # Mock actions are already structured; no JSON round-trip needed
+                action_dict = self._get_mock_action(observation, info)
+                logger.debug("AGENT [%s] - Using mock behavior: %s", self.name, self.mock_behavior)
             else:
                 # Fallback to original AutoGen chat
-                print(f"AGENT [{self.name}] - Using AutoGen chat")
-                if asyncio.iscoroutinefunction(self.agent.chat):
-                    reply = await self.agent.chat(formatted_prompt)
+                logger.debug("AGENT [%s] - Using AutoGen chat", self.name)
+                if self._chat is None:
+                    raise AttributeError(f"{type(self.agent).__name__} has no chat() method")
+                if self._chat_is_async:
+                    reply = await self._chat(formatted_prompt)
                 else:
                     loop = asyncio.get_running_loop()
-                    reply = await loop.run_in_executor(None, self.agent.chat, formatted_prompt)
+                    reply = await loop.run_in_executor(llm_executor(), self._chat, formatted_prompt)
             
             # Parse the response
-            try:
-                content = str(reply).strip()
-                # Extract JSON from response (handle case where LLM adds extra text)
-                if '{' in content and '}' in content:
-                    json_start = content.find('{')
-                    json_end = content.rfind('}') + 1
-                    json_str = content[json_start:json_end]
-                    action_dict = json.loads(json_str)
-                else:
-                    action_dict = json.loads(content)
-            except json.JSONDecodeError:
-                print(f"Failed to parse LLM response: {reply}")
-                action_dict = {"action": 0}  # Default fallback
+            if action_dict is None:
+                try:
+                    action_dict = _parse_reply(reply)
+                except json.JSONDecodeError:
+                    logger.warning("AGENT [%s] - Failed to parse LLM response: %s", self.name, reply)
+                    action_dict = {"action": 0}  # Default fallback
 
-            print(f"AGENT [{self.name}] - Chosen Action: {action_dict}") # Log the full dict
+            logger.debug("AGENT [%s] - Chosen Action: %s", self.name, action_dict)  # Log the full dict
             
             # Handle case where action might be just an integer
             if isinstance(action_dict, dict) and 'action' in action_dict:
-                return action_dict['action']
+                action = action_dict['action']
             elif isinstance(action_dict, (int, float)):
-                return int(action_dict)
+                action = int(action_dict)
             else:
-                print(f"Unexpected action format: {action_dict}")
+                logger.warning("AGENT [%s] - Unexpected action format: %s", self.name, action_dict)
                 return 0  # Default action
+
+            if cache_key is not None:
+                self._RESPONSE_CACHE.put(cache_key, action)
+            return action
                 
         except Exception as e:
-            print(f"AGENT [{self.name}] - Error in act_async: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("AGENT [%s] - Error in act_async: %s", self.name, e)
             return 0  # Default action on error
 
+    @classmethod
+    async def batch_act_async(cls, agents: Sequence["AutoGenAgentAdapter"],
+                              observations: Sequence[Dict[str, Any]],
+                              info: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """Act with several agents of this class as one unit of work.
+
+        The orchestrator hands all agents of a class to a single call when
+        ``batch_actions`` is enabled. This default simply runs their
+        ``act_async`` calls concurrently; subclasses that can fuse requests
+        (see BatchingAgentAdapter) override it. Returns actions in agent order.
+        """
+        return await asyncio.gather(*(a.act_async(o, info) for a, o in zip(agents, observations)))
+
+    async def _generate(self, prompt: str) -> str:
+        """Get the LLM reply for one prompt; subclasses may route it elsewhere.
+
+        The reply is either text to be parsed or an already decoded JSON value.
+        """
+        # generate() blocks on HTTP; run it off-loop so concurrent agents overlap
+        # Prefer clients that decode JSON replies themselves
+        generate = getattr(self.llm_client, 'generate_json', None) or self.llm_client.generate
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(llm_executor(), generate, prompt)
+
+    def _cache_enabled(self) -> bool:
+        """Responses are only reusable when generation is deterministic."""
+        return (self.enable_cache and self.llm_client is not None
+                and not getattr(self.llm_client, 'temperature', 1))
+
+    @classmethod
+    def cache_stats(cls) -> Dict[str, int]:
+        """Hit/miss counters of the shared response cache."""
+        return cls._RESPONSE_CACHE.stats()
+
+    @property
+    def mock_behavior(self) -> Optional[Union[str, Dict[str, Any]]]:
+        return self._mock_behavior
+
+    @mock_behavior.setter
+    def mock_behavior(self, behavior: Optional[Union[str, Dict[str, Any]]]) -> None:
+        # The behavior is fixed per agent; dispatch on its type once, not every step
+        self._mock_behavior = behavior
+        self._mock_fn = _compile_mock_behavior(behavior, self._rng)
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """Re-seed the adapter's RNG for a new episode.
+
+        The seed is combined with the agent's name so agents sharing an
+        episode seed still draw independent sequences.
+        """
+        self._rng.seed(f"{seed}:{self.name}")
+
     def _get_mock_action(self, observation: Dict[str, Any], info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Generate action based on mock behavior configuration."""
-        if isinstance(self.mock_behavior, str):
-            # Simple string behaviors
-            if self.mock_behavior == "always_low":
-                return {"action": 0}
-            elif self.mock_behavior == "always_high":
-                return {"action": 9}
-            elif self.mock_behavior == "always_medium":
-                return {"action": 5}
-            elif self.mock_behavior == "random":
-                import random
-                return {"action": random.randint(0, 9)}
-            elif self.mock_behavior == "tit_for_tat":
-                # Mirror opponent's last action
-                opponent_price = observation.get('opponent_last_price', 5)
-                return {"action": int(opponent_price)}
-            else:
-                # Default if unknown behavior
-                return {"action": 0}
-        elif isinstance(self.mock_behavior, dict):
-            # Complex configurable behaviors
-            behavior_type = self.mock_behavior.get('type', 'fixed')
-            
-            if behavior_type == 'fixed':
-                return {"action": self.mock_behavior.get('action', 0)}
-            elif behavior_type == 'pattern':
-                # Cycle through a pattern of actions
-                pattern = self.mock_behavior.get('pattern', [0])
-                round_num = observation.get('round_num', 0)
-                action = pattern[round_num % len(pattern)]
-                return {"action": action}
-            elif behavior_type == 'conditional':
-                # Conditional logic based on observation
-                conditions = self.mock_behavior.get('conditions', [])
-                for condition in conditions:
-                    if self._evaluate_condition(condition, observation):
-                        return {"action": condition.get('action', 0)}
-                # Default action if no conditions match
-                return {"action": self.mock_behavior.get('default_action', 0)}
-            else:
-                return {"action": 0}
-        else:
-            # Fallback
-            return {"action": 0}
-    
-    def _evaluate_condition(self, condition: Dict[str, Any], observation: Dict[str, Any]) -> bool:
-        """Evaluate a condition against the observation."""
-        field = condition.get('field')
-        operator = condition.get('operator', '==')
-        value = condition.get('value')
-        
-        if field not in observation:
-            return False
-            
-        obs_value = observation[field]
-        
-        if operator == '==':
-            return obs_value == value
-        elif operator == '>':
-            return obs_value > value
-        elif operator == '<':
-            return obs_value < value
-        elif operator == '>=':
-            return obs_value >= value
-        elif operator == '<=':
-            return obs_value <= value
-        else:
-            return False
+        return self._mock_fn(observation, info)
 
     def act(self, observation: Dict[str, Any], info: Optional[Dict[str, Any]] = None) -> Any:
-        return asyncio.run(self.act_async(observation, info))
\ No newline at end of file
+        # Reuse one loop per thread rather than building and tearing one down per step
+        return _thread_loop().run_until_complete(self.act_async(observation, info))
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""Adapter that fuses concurrent LLM calls of several episodes into one request."""
+from __future__ import annotations
+import asyncio, json, logging, weakref
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from safety_governor.adapters.autogen_agent_adapter import AutoGenAgentAdapter, _parse_reply, llm_executor
+
+logger = logging.getLogger(__name__)
+
+_BATCH_HEADER = (
+    "You will receive {n} independent requests, numbered 0 to {last}. "
+    "Answer each one on its own, exactly as it instructs.\n"
+    'Reply with ONLY: {{"actions": [<answer 0>, <answer 1>, ...]}} '
+    "where each answer is the action number you would have chosen for that request.\n"
+)
+
+
+class _MicroBatcher:
+    """Collects prompts submitted within a short window and sends them as one call.
+
+    A batch is flushed once it holds ``max_batch`` prompts or ``max_wait_ms``
+    after its first prompt arrived, whichever comes first. A batch never holds
+    two prompts of the same episode: such a prompt flushes the pending batch
+    and starts the next one. Replies that cannot be split back into one action
+    per prompt are retried prompt by prompt.
+    """
+
+    def __init__(self, client: Any, max_batch: int, max_wait_ms: float):
+        self.client = client
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._episodes: Set[Hashable] = set()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Running dispatches; referenced so they are not garbage collected mid-flight
+        self._dispatches: Set[asyncio.Task] = set()
+
+    def submit(self, prompt: str, episode: Hashable = None) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        if episode in self._episodes:
+            self._flush()
+        fut = loop.create_future()
+        self._pending.append((prompt, fut))
+        self._episodes.add(episode)
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return fut
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        self._episodes = set()
+        if batch:
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    @staticmethod
+    def _batch_prompt(prompts: List[str]) -> str:
+        parts = [_BATCH_HEADER.format(n=len(prompts), last=len(prompts) - 1)]
+        for i, prompt in enumerate(prompts):
+            parts.append(f"\n### Request {i}\n{prompt}\n")
+        return "".join(parts)
+
+    @staticmethod
+    def _split(reply: str, n: int) -> Optional[List[str]]:
+        """Turn ``{"actions": [...]}`` into one single-action reply per prompt."""
+        try:
+            actions = _parse_reply(reply)["actions"]
+        except (json.JSONDecodeError, TypeError, KeyError):
+            return None
+        if not isinstance(actions, list) or len(actions) != n:
+            return None
+        return [json.dumps(a if isinstance(a, dict) else {"action": a}) for a in actions]
+
+
+class BatchingAgentAdapter(AutoGenAgentAdapter):
+    """AutoGenAgentAdapter whose LLM calls are micro-batched across episodes.
+
+    Agents on the same event loop that talk to the same provider/model share
+    a batcher, so several episodes stepping together (e.g. seeds driven on one
+    loop) cost a single LLM request per step.
+
+    Prompts of the same episode are never fused. In the price game those are
+    the competing firms, and letting one model context choose every firm's
+    price would itself coordinate them, confounding the tacit-collusion
+    measurement. The episode is the seed passed to ``reset``; adapters that
+    were never reset count as one episode and are never batched together.
+    Mock and plain AutoGen agents behave exactly like the base adapter.
+
+    Args:
+        max_batch: Largest number of prompts fused into one request.
+        max_wait_ms: How long the first prompt of a batch waits for company.
+        **kwargs: Forwarded to AutoGenAgentAdapter.
+    """
+
+    # One set of batchers per event loop; entries vanish with their loop
+    _BATCHERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, _MicroBatcher]]" = \
+        weakref.WeakKeyDictionary()
+
+    def __init__(self, *args: Any, max_batch: int = 32, max_wait_ms: float = 5.0, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be non-negative")
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self._episode: Hashable = None
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        super().reset(seed)
+        self._episode = seed
+
+    def _batch_key(self) -> Hashable:
+        client = self.llm_client
+        return (client.provider, client.model, getattr(client, 'api_base', None),
+                getattr(client, 'temperature', None), self.max_batch, self.max_wait_ms)
+
+    async def _generate(self, prompt: str) -> str:
+        loop = asyncio.get_running_loop()
+        batchers = self._BATCHERS.setdefault(loop, {})
+        key = self._batch_key()
+        batcher = batchers.get(key)
+        if batcher is None:
+            batcher = batchers[key] = _MicroBatcher(self.llm_client, self.max_batch, self.max_wait_ms)
+        return await batcher.submit(prompt, self._episode)
+
+    @classmethod
+    async def batch_act_async(cls, agents: Sequence[AutoGenAgentAdapter],
+                              observations: Sequence[Dict[str, Any]],
+                              info: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """Act with all ``agents`` and send their prompts without waiting for company.
+
+        Every agent's prompt is known to be part of this step, so once they
+        have all been submitted the batches are flushed right away instead of
+        after ``max_wait_ms``. Agents of one episode still get separate
+        requests (see the class docstring).
+        """
+        tasks = [asyncio.ensure_future(a.act_async(o, info)) for a, o in zip(agents, observations)]
+        await asyncio.sleep(0)  # let every agent reach its batcher
+        for batcher in cls._BATCHERS.get(asyncio.get_running_loop(), {}).values():
+            batcher._flush()
+        return await asyncio.gather(*tasks)
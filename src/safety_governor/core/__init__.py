@@ -1,5 +1,5 @@
 """Core components of the safety governor system."""
 
-from .orchestrator import Orchestrator, load
+from .orchestrator import Orchestrator, load, load_config
 
-__all__ = ["Orchestrator", "load"]
\ No newline at end of file
+__all__ = ["Orchestrator", "load", "load_config"]
\ No newline at end of file
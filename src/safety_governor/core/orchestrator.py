@@ -1,13 +1,21 @@
 
+import asyncio
+import copy
+import functools
 import importlib
+import itertools
 import random
 import yaml
-import copy
 import logging
+import os
 import sys
 import signal
-from typing import Dict, Any, List, Optional, Generator
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Optional, Generator, Tuple
 from ..environments import get_env_cls
+from ..utils.aio import new_event_loop
 
 # Configure logging
 logging.basicConfig(
@@ -20,8 +28,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=None)
 def load(path: str):
-    """Dynamically load a class from module path."""
+    """Dynamically load a class from module path.
+
+    Results are memoized: specs are re-resolved for every seed, and the
+    import/getattr lookup never changes for a given path.
+    """
     try:
         if ':' not in path:
             raise ValueError(f"Invalid path format: {path}. Expected 'module:class'")
@@ -38,10 +51,72 @@ def load(path: str):
         logger.error(f"Unexpected error loading '{path}': {e}")
         raise
 
+@functools.lru_cache(maxsize=None)
+def _resolve_factory(factory_path: str):
+    """Resolve a dotted 'module.attr' factory path (e.g. autogen.ConversableAgent)."""
+    factory_mod, factory_cls = factory_path.rsplit('.', 1)
+    return getattr(importlib.import_module(factory_mod), factory_cls)
+
+# libyaml's C loader is several times faster than the pure-Python one
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(path: str, mtime_ns: int) -> Any:
+    with open(path) as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+def load_config(path: str) -> Any:
+    """Load a YAML config file, parsing each version of a file only once.
+
+    The cache is keyed on the file's modification time, so edited files are
+    re-read. Callers get their own copy and may modify it freely.
+    """
+    return copy.deepcopy(_parse_config(path, os.stat(path).st_mtime_ns))
+
+
+async def _with_timeout(aw: Any, timeout: float, aid: Any) -> Any:
+    """Await one agent's action, substituting the default action after ``timeout``."""
+    try:
+        return await asyncio.wait_for(aw, timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Agent '{aid}' did not act within {timeout}s, using default action")
+        return [{'action': 0}] * len(aid) if isinstance(aid, tuple) else {'action': 0}
+
+
+async def _gather_fail_fast(pending: List[Any]) -> List[asyncio.Future]:
+    """Run ``pending`` concurrently, cancelling the rest once one of them fails.
+
+    Returns the finished tasks in input order; callers read ``result()`` /
+    ``exception()`` from them. Tasks may already be done when created (eager
+    task factories), so nothing relies on done callbacks having run.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in pending]
+    if not tasks:
+        return tasks
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        unfinished = [t for t in tasks if not t.done()]
+        for t in unfinished:
+            t.cancel()
+        if unfinished:
+            await asyncio.wait(unfinished)
+    return tasks
+
+
 class Orchestrator:
     def __init__(self, cfg: Dict[str, Any]):
         self.cfg = cfg
         self.shutdown_requested = False
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Built once by _prepare() and reused for every seed
+        self._env = None
+        self._agents: Dict[str, Any] = {}
+        self._defenses: Dict[str, Any] = {}
+        self._defense_hooks: List[Tuple[str, Optional[Callable], Optional[Callable]]] = []
+        self._async_inspects: Dict[str, Callable] = {}
+        # ((agents, len, batch_actions), slots, calls) memoized by _act_plan
+        self._plan: Optional[Tuple[Tuple[Any, int, bool], List[Any], List[Tuple[Any, Any]]]] = None
         logger.info("Orchestrator initialized with config")
         
         # Set up signal handlers for graceful shutdown
@@ -53,6 +128,155 @@ class Orchestrator:
         logger.info(f"Received signal {signum}, initiating graceful shutdown...")
         self.shutdown_requested = True
 
+    def _get_pool(self, num_agents: int) -> ThreadPoolExecutor:
+        """Return the shared agent thread pool, creating it on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=max(4, num_agents),
+                                            thread_name_prefix="agent-act")
+        return self._pool
+
+    def close(self) -> None:
+        """Release the agent thread pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def _new_loop(self) -> asyncio.AbstractEventLoop:
+        """Create the event loop that drives one simulation run.
+
+        uvloop is used when installed unless the config sets ``use_uvloop: false``.
+        On Python 3.12+ tasks start eagerly (``eager_tasks``, default on): agent
+        coroutines that finish without suspending, such as mock or cached
+        agents, then complete inside ``gather`` without a scheduling round trip.
+
+        Runs drive their own loop, so they cannot start from inside a running
+        one; that is reported up front instead of failing mid-setup.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "Orchestrator runs cannot start inside a running event loop; "
+                "call them from a worker thread, e.g. "
+                "`await loop.run_in_executor(None, orch.run_seed, seed)`")
+        loop = new_event_loop(prefer_uvloop=self.cfg.get('use_uvloop', True))
+        if self.cfg.get('eager_tasks', True) and hasattr(asyncio, 'eager_task_factory'):
+            loop.set_task_factory(asyncio.eager_task_factory)
+        return loop
+
+    @staticmethod
+    def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+        """Shut down a loop created by ``_new_loop``."""
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            loop.close()
+
+    async def _collect_actions(self, agents: Dict[str, Any], obs: Any) -> Dict[str, Any]:
+        """Ask every agent for an action concurrently.
+
+        Agents exposing ``act_async`` are awaited directly on the running loop;
+        sync-only agents run on the shared thread pool. Agent calls are mostly
+        I/O bound (LLM requests), so a step takes ~max(t_i) instead of sum(t_i).
+
+        With ``fail_fast`` (the default) the first failure cancels the agents
+        still waiting on their LLM instead of letting the whole step finish
+        first. Results are read back from the tasks in agent order.
+
+        ``action_timeout`` (seconds, off by default) bounds each agent on its
+        own: a straggler gets the default action while the others keep their
+        answers. Sync agents that time out keep running on their thread.
+        """
+        loop = asyncio.get_running_loop()
+        batched = self.cfg.get('batch_actions', False)
+        slots, calls = self._act_plan(agents, batched)
+        pending = []
+        for act_async, target in calls:
+            if act_async is None:
+                pending.append(loop.run_in_executor(self._get_pool(len(agents)), target, obs))
+            elif target is None:
+                pending.append(act_async(obs))
+            else:
+                pending.append(act_async(target, [obs] * len(target)))
+        timeout = self.cfg.get('action_timeout')
+        if timeout:
+            pending = [_with_timeout(aw, timeout, aid) for aid, aw in zip(slots, pending)]
+
+        if self.cfg.get('fail_fast', True):
+            tasks = await _gather_fail_fast(pending)
+            for aid, task in zip(slots, tasks):
+                if not task.cancelled() and task.exception() is not None:
+                    logger.error(f"Agent '{aid}' failed to act: {task.exception()}")
+                    raise task.exception()
+            results = [task.result() for task in tasks]
+        else:
+            results = await asyncio.gather(*pending, return_exceptions=True)
+
+        acts = {}
+        for aid, result in zip(slots, results):
+            if isinstance(result, Exception):
+                logger.error(f"Agent '{aid}' failed to act: {result}")
+                # Use a default action if agent fails
+                result = {'action': 0}
+                if isinstance(aid, tuple):
+                    result = [result] * len(aid)
+            if isinstance(aid, tuple):
+                acts.update(zip(aid, result))
+            else:
+                acts[aid] = result
+        # Keep the configured agent order regardless of grouping
+        return {aid: acts[aid] for aid in agents} if batched else acts
+
+    def _act_plan(self, agents: Dict[str, Any], batched: bool) -> Tuple[List[Any], List[Tuple[Any, Any]]]:
+        """Resolve how each agent is called, once per agents mapping.
+
+        Returns result slots (an agent id, or a tuple of ids for a batch) and
+        matching ``(act_async, target)`` pairs: ``(None, act)`` for sync agents,
+        ``(act_async, None)`` for async ones and ``(batch_act_async, agents)``
+        for batches. Saves the getattr/iscoroutinefunction probing per step.
+        """
+        plan = self._plan
+        if plan is not None:
+            (known, size, was_batched), slots, calls = plan
+            if known is agents and size == len(agents) and was_batched == batched:
+                return slots, calls
+        slots, calls = [], []
+        for aid, ag in (self._group_agents(agents) if batched else agents.items()):
+            slots.append(aid)
+            if isinstance(aid, tuple):
+                calls.append((type(ag[0]).batch_act_async, ag))
+                continue
+            act_async = getattr(ag, 'act_async', None)
+            if act_async is not None and asyncio.iscoroutinefunction(act_async):
+                calls.append((act_async, None))
+            else:
+                calls.append((None, ag.act))
+        self._plan = ((agents, len(agents), batched), slots, calls)
+        return slots, calls
+
+    @staticmethod
+    def _group_agents(agents: Dict[str, Any]) -> List[Tuple[Any, Any]]:
+        """Pair agent ids with agents, fusing classes that offer ``batch_act_async``.
+
+        Every class with two or more agents and a ``batch_act_async`` hook
+        becomes one ``(ids_tuple, agents_list)`` entry; all other agents stay
+        ``(id, agent)`` pairs.
+        """
+        groups: Dict[type, List[Tuple[str, Any]]] = {}
+        for aid, ag in agents.items():
+            groups.setdefault(type(ag), []).append((aid, ag))
+        units = []
+        for cls, members in groups.items():
+            if len(members) > 1 and hasattr(cls, 'batch_act_async'):
+                ids, ags = zip(*members)
+                units.append((ids, list(ags)))
+            else:
+                units.extend(members)
+        return units
+
     def _build(self, specs: str) -> Dict[str, Any]:
         """Build components from specifications."""
         components = {}
@@ -88,7 +312,9 @@ class Orchestrator:
             
         for spec_orig in self.cfg['agents']:
             try:
-                spec = copy.deepcopy(spec_orig)
+                # Shallow copies are enough: only top-level keys of spec, params
+                # and the autogen_agent block are popped, nested values are read-only
+                spec = dict(spec_orig)
                 
                 if 'id' not in spec:
                     logger.error(f"Missing 'id' in agent specification: {spec}")
@@ -101,19 +327,17 @@ class Orchestrator:
                 logger.debug(f"Creating agent '{agent_id}'")
                 
                 cls = load(spec['impl'])
-                params = spec.get('params', {})
+                params = dict(spec.get('params', {}))
                 
                 # Handle autogen factory shortcut
                 if 'autogen_agent' in params:
                     try:
-                        ag_cfg = params.pop('autogen_agent')
+                        ag_cfg = dict(params.pop('autogen_agent'))
                         if '_factory' not in ag_cfg:
                             logger.error(f"Missing '_factory' in autogen_agent config for agent '{agent_id}'")
                             continue
                             
-                        factory_path = ag_cfg.pop('_factory')
-                        factory_mod, factory_cls = factory_path.rsplit('.', 1)
-                        factory = getattr(importlib.import_module(factory_mod), factory_cls)
+                        factory = _resolve_factory(ag_cfg.pop('_factory'))
                         params['autogen_agent'] = factory(**ag_cfg)
                     except Exception as e:
                         logger.error(f"Failed to create autogen agent for '{agent_id}': {e}")
@@ -130,43 +354,121 @@ class Orchestrator:
                     
         return agents
 
-    def run_seed(self, seed: int) -> Dict[str, float]:
-        """Run a single simulation with the given seed."""
-        logger.info(f"Starting simulation with seed {seed}")
-        
-        try:
-            random.seed(seed)
-            
-            # Create environment
+    def _prepare(self):
+        """Build the environment, agents and defenses on first use.
+
+        Construction (imports, AutoGen agents, LLM clients, event bus
+        subscriptions) happens once per orchestrator instead of once per seed;
+        ``reset`` restores per-episode state between seeds.
+        """
+        if self._env is None:
             if 'base_env' not in self.cfg:
                 raise ValueError("Missing 'base_env' in configuration")
             env = get_env_cls(self.cfg['base_env'])()
-            
-            # Create agents and defenses
+
             agents = self._make_agents()
             if not agents:
                 raise ValueError("No agents were successfully created")
-                
+
             defenses = self._build('defenses')
-            
-            # Initialize environment
-            obs, _ = env.reset(seed=seed)
+            # Resolve each defense's hooks once as bound methods instead of
+            # probing them with hasattr on every step
+            self._defense_hooks = [
+                (def_id, getattr(ref, 'inspect', None), getattr(ref, 'intervene', None))
+                for def_id, ref in defenses.items()
+            ]
+            self._async_inspects = {
+                def_id: ref.ainspect for def_id, ref in defenses.items()
+                if asyncio.iscoroutinefunction(getattr(ref, 'ainspect', None))
+            }
+            self._env, self._agents, self._defenses = env, agents, defenses
+        return self._env, self._agents, self._defenses
+
+    def _apply_defenses(self, acts: Dict[str, Any], env: Any,
+                        loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Let every defense inspect the step's actions and intervene on the env.
+
+        Defenses run one after another in config order. If any defense offers
+        an async ``ainspect`` (e.g. one backed by an LLM), all inspections run
+        concurrently on ``loop`` first, sync ones on the agent thread pool, and
+        the interventions follow in config order.
+        """
+        if not self._async_inspects or loop is None:
+            for def_id, inspect, intervene in self._defense_hooks:
+                try:
+                    if inspect is not None:
+                        inspect(acts)
+                    if intervene is not None:
+                        intervene(env)
+                except Exception as e:
+                    logger.error(f"Defense '{def_id}' failed: {e}")
+                    if self.cfg.get('fail_fast', True):
+                        raise
+            return
+
+        loop.run_until_complete(self._inspect_concurrently(acts))
+        for def_id, _, intervene in self._defense_hooks:
+            if intervene is None:
+                continue
+            try:
+                intervene(env)
+            except Exception as e:
+                logger.error(f"Defense '{def_id}' failed: {e}")
+                if self.cfg.get('fail_fast', True):
+                    raise
+
+    async def _inspect_concurrently(self, acts: Dict[str, Any]) -> None:
+        """Run all defense inspections of one step at the same time."""
+        loop = asyncio.get_running_loop()
+        ids, pending = [], []
+        for def_id, inspect, _ in self._defense_hooks:
+            ainspect = self._async_inspects.get(def_id)
+            if ainspect is not None:
+                pending.append(ainspect(acts))
+            elif inspect is not None:
+                pending.append(loop.run_in_executor(self._get_pool(len(self._defense_hooks)), inspect, acts))
+            else:
+                continue
+            ids.append(def_id)
+        for def_id, result in zip(ids, await asyncio.gather(*pending, return_exceptions=True)):
+            if isinstance(result, Exception):
+                logger.error(f"Defense '{def_id}' failed: {result}")
+                if self.cfg.get('fail_fast', True):
+                    raise result
+
+    def reset(self, seed: int) -> Any:
+        """Re-seed and reset every component for a new episode.
+
+        Components are built on first use and then reused, so an orchestrator
+        can run any number of seeds without reconstructing agents or LLM
+        clients. Returns the initial observation.
+        """
+        self._prepare()
+        random.seed(seed)
+        obs, _ = self._env.reset(seed=seed)
+        for ag in self._agents.values():
+            if hasattr(ag, 'reset'):
+                ag.reset(seed)
+        for ref in self._defenses.values():
+            if hasattr(ref, 'reset'):
+                ref.reset()
+        return obs
+
+    def run_seed(self, seed: int) -> Dict[str, float]:
+        """Run a single simulation with the given seed."""
+        logger.info(f"Starting simulation with seed {seed}")
+        
+        loop = self._new_loop()
+        try:
+            env, agents, defenses = self._prepare()
+            obs = self.reset(seed)
             total = {k: 0.0 for k in agents}
             step_count = 0
             max_steps = getattr(env, 'max_steps', 10000)  # Prevent infinite loops
             
             while not self.shutdown_requested and step_count < max_steps:
                 # Collect actions from agents
-                acts = {}
-                for aid, ag in agents.items():
-                    try:
-                        acts[aid] = ag.act(obs)
-                    except Exception as e:
-                        logger.error(f"Agent '{aid}' failed to act: {e}")
-                        if self.cfg.get('fail_fast', True):
-                            raise
-                        # Use a default action if agent fails
-                        acts[aid] = {'action': 0}
+                acts = loop.run_until_complete(self._collect_actions(agents, obs))
                 
                 # Step environment
                 try:
@@ -180,16 +482,7 @@ class Orchestrator:
                     total[k] += rew[k]
                     
                 # Apply defenses
-                for def_id, ref in defenses.items():
-                    try:
-                        if hasattr(ref, 'inspect'):
-                            ref.inspect(acts)
-                        if hasattr(ref, 'intervene'):
-                            ref.intervene(env)
-                    except Exception as e:
-                        logger.error(f"Defense '{def_id}' failed: {e}")
-                        if self.cfg.get('fail_fast', True):
-                            raise
+                self._apply_defenses(acts, env, loop)
                             
                 step_count += 1
                 if done:
@@ -206,6 +499,19 @@ class Orchestrator:
         except Exception as e:
             logger.error(f"Simulation failed for seed {seed}: {e}")
             raise
+        finally:
+            self._close_loop(loop)
+
+    def _stream_snapshot(self):
+        """Return the function used to expose mappings in stream events."""
+        mode = self.cfg.get('stream_copy', 'view')
+        if mode == 'view':
+            return MappingProxyType
+        if mode == 'shallow':
+            return dict
+        if mode == 'deep':
+            return copy.deepcopy
+        raise ValueError(f"Invalid stream_copy mode: {mode!r}. Expected 'view', 'shallow' or 'deep'")
 
     def run_seed_stream(self, seed: int) -> Generator[Dict[str, Any], None, None]:
         """Yield detailed info for each step of a simulation run.
@@ -217,49 +523,34 @@ class Orchestrator:
         - ``step``: emitted after every environment step with ``actions``,
           ``reward`` and cumulative ``total`` rewards.
         - ``summary``: emitted once the environment reaches ``done``.
+
+        ``observation`` and ``total`` are read-only views by default; set
+        ``stream_copy`` to ``'shallow'`` or ``'deep'`` in the config to get
+        independent copies instead. Totals are rebuilt every step, so views
+        of earlier events never change.
         """
         logger.info(f"Starting stream simulation with seed {seed}")
         
+        loop = self._new_loop()
         try:
-            random.seed(seed)
-            
-            # Create environment
-            if 'base_env' not in self.cfg:
-                raise ValueError("Missing 'base_env' in configuration")
-            env = get_env_cls(self.cfg['base_env'])()
-            
-            # Create agents and defenses
-            agents = self._make_agents()
-            if not agents:
-                raise ValueError("No agents were successfully created")
-                
-            defenses = self._build('defenses')
-            
-            # Initialize environment
-            obs, _ = env.reset(seed=seed)
+            env, agents, defenses = self._prepare()
+            obs = self.reset(seed)
             total = {k: 0.0 for k in agents}
             step_count = 0
             max_steps = getattr(env, 'max_steps', 10000)
+            snapshot = self._stream_snapshot()
             
             yield {
                 'type': 'reset',
                 'step': step_count,
-                'observation': obs.copy(),
-                'total': total.copy(),
+                'observation': snapshot(obs),
+                'total': snapshot(total),
                 'max_steps': max_steps
             }
             
             while not self.shutdown_requested and step_count < max_steps:
                 # Collect actions from agents
-                acts = {}
-                for aid, ag in agents.items():
-                    try:
-                        acts[aid] = ag.act(obs)
-                    except Exception as e:
-                        logger.error(f"Agent '{aid}' failed to act: {e}")
-                        if self.cfg.get('fail_fast', True):
-                            raise
-                        acts[aid] = {'action': 0}
+                acts = loop.run_until_complete(self._collect_actions(agents, obs))
                 
                 # Step environment
                 try:
@@ -268,21 +559,11 @@ class Orchestrator:
                     logger.error(f"Environment step failed: {e}")
                     raise
                     
-                # Update rewards
-                for k in total:
-                    total[k] += rew[k]
+                # Update rewards (new dict so earlier yielded totals stay valid)
+                total = {k: v + rew[k] for k, v in total.items()}
                     
                 # Apply defenses
-                for def_id, ref in defenses.items():
-                    try:
-                        if hasattr(ref, 'inspect'):
-                            ref.inspect(acts)
-                        if hasattr(ref, 'intervene'):
-                            ref.intervene(env)
-                    except Exception as e:
-                        logger.error(f"Defense '{def_id}' failed: {e}")
-                        if self.cfg.get('fail_fast', True):
-                            raise
+                self._apply_defenses(acts, env, loop)
                             
                 step_count += 1
                 
@@ -291,8 +572,8 @@ class Orchestrator:
                     'step': step_count,
                     'actions': acts,
                     'reward': rew,
-                    'observation': obs.copy(),
-                    'total': total.copy()
+                    'observation': snapshot(obs),
+                    'total': snapshot(total)
                 }
                 
                 if done:
@@ -306,15 +587,17 @@ class Orchestrator:
             yield {
                 'type': 'summary',
                 'step': step_count,
-                'total': total.copy()
+                'total': snapshot(total)
             }
             
         except Exception as e:
             logger.error(f"Stream simulation failed for seed {seed}: {e}")
             raise
+        finally:
+            self._close_loop(loop)
 
-    def run(self) -> List[Dict[str, float]]:
-        """Run simulations for all configured seeds."""
+    def _seeds(self):
+        """Parse the ``seeds`` config entry into an iterable of seeds."""
         if 'seeds' not in self.cfg:
             raise ValueError("Missing 'seeds' in configuration")
             
@@ -332,34 +615,103 @@ class Orchestrator:
             seeds = [seeds]
         elif not isinstance(seeds, list):
             raise ValueError(f"Invalid seeds format: {type(seeds)}")
-            
-        results = []
-        for s in seeds:
-            if self.shutdown_requested:
-                logger.info("Shutdown requested, stopping simulations")
-                break
-            try:
-                result = self.run_seed(int(s))
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to run seed {s}: {e}")
-                if self.cfg.get('fail_fast', True):
-                    raise
-                    
-        return results
+        return seeds
+
+    def run(self) -> List[Dict[str, float]]:
+        """Run simulations for all configured seeds."""
+        return list(self.run_iter())
+
+    def run_iter(self) -> Generator[Dict[str, float], None, None]:
+        """Yield the result of each configured seed as soon as it is available.
+
+        Results come in seed order. Unlike ``run()`` nothing is accumulated,
+        so large sweeps can be reduced online in constant memory.
+        """
+        seeds = self._seeds()
+        parallel = int(self.cfg.get('parallel_seeds', 1) or 1)
+        if parallel > 1:
+            yield from self._iter_parallel(seeds, parallel)
+            return
+
+        try:
+            for s in seeds:
+                if self.shutdown_requested:
+                    logger.info("Shutdown requested, stopping simulations")
+                    break
+                try:
+                    result = self.run_seed(int(s))
+                except Exception as e:
+                    logger.error(f"Failed to run seed {s}: {e}")
+                    if self.cfg.get('fail_fast', True):
+                        raise
+                    continue
+                yield result
+        finally:
+            self.close()
+
+    def _iter_parallel(self, seeds, workers: int) -> Generator[Dict[str, float], None, None]:
+        """Run seeds in a process pool (``parallel_seeds`` in the config).
+
+        Seeds are independent replications and the step loop is GIL-bound
+        Python, so processes rather than threads. Results keep seed order;
+        at most ``2 * workers`` seeds are in flight, so finished results
+        never pile up ahead of the consumer.
+        """
+        logger.info(f"Running {len(seeds)} seeds on {workers} worker processes")
+        ex = ProcessPoolExecutor(max_workers=workers, initializer=_init_seed_worker,
+                                 initargs=(self.cfg,))
+        pending = deque()
+        seed_iter = iter(seeds)
+        try:
+            for s in itertools.islice(seed_iter, 2 * workers):
+                pending.append((s, ex.submit(_run_seed_worker, int(s))))
+            while pending:
+                if self.shutdown_requested:
+                    logger.info("Shutdown requested, stopping simulations")
+                    break
+                s, future = pending.popleft()
+                for nxt in itertools.islice(seed_iter, 1):
+                    pending.append((nxt, ex.submit(_run_seed_worker, int(nxt))))
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to run seed {s}: {e}")
+                    if self.cfg.get('fail_fast', True):
+                        raise
+                    continue
+                yield result
+        finally:
+            # Don't start queued seeds after a failure or shutdown request
+            ex.shutdown(wait=True, cancel_futures=True)
+
+# Per-process orchestrator used by ``Orchestrator._iter_parallel`` workers
+_worker_orchestrator: Optional[Orchestrator] = None
+
+def _init_seed_worker(cfg: Dict[str, Any]) -> None:
+    """Process-pool initializer: build one orchestrator per worker process."""
+    global _worker_orchestrator
+    _worker_orchestrator = Orchestrator(cfg)
+    # The parent handles Ctrl-C and stops handing out seeds
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def _run_seed_worker(seed: int) -> Dict[str, float]:
+    """Run one seed in a worker process."""
+    return _worker_orchestrator.run_seed(seed)
 
 def main(path: str):
     """Main entry point for running orchestrator."""
     try:
         logger.info(f"Loading configuration from {path}")
-        with open(path) as f:
-            cfg = yaml.safe_load(f)
+        cfg = load_config(path)
             
         if not cfg:
             raise ValueError("Configuration file is empty")
             
         orchestrator = Orchestrator(cfg)
-        orchestrator.run()
+        completed = 0
+        for completed, _ in enumerate(orchestrator.run_iter(), 1):
+            logger.debug(f"{completed} seed(s) completed")
+        logger.info(f"Finished {completed} seed(s)")
     except FileNotFoundError:
         logger.error(f"Configuration file not found: {path}")
         sys.exit(1)
@@ -1,18 +1,26 @@
 
 """Governor that resets environment on first alert."""
+import logging
 from ..utils import event_bus
 
+logger = logging.getLogger(__name__)
+
 class HierarchicalGovernor:
     def __init__(self):
         self.alert_flag = False
         event_bus.subscribe("alert", self._on_alert)
 
     def _on_alert(self, event_type, payload):
-        print("[Governor] ALERT:", payload)
+        # Sustained collusion alerts every step; lazy args keep that cheap when filtered
+        logger.warning("[Governor] ALERT: %s", payload)
         self.alert_flag = True
 
+    def reset(self):
+        """Drop any pending alert, e.g. between episodes."""
+        self.alert_flag = False
+
     def intervene(self, env):
         if self.alert_flag:
-            print("[Governor] Intervening – resetting environment")
+            logger.info("[Governor] Intervening – resetting environment")
             env.reset()
             self.alert_flag = False
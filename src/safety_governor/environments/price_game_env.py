@@ -7,6 +7,9 @@ import numpy as np
 class PriceGameEnv(gym.Env):
     metadata = {}
 
+    # Larger price ranges compute rewards and prices per step instead
+    _TABLE_MAX_ACTIONS = 256
+
     def __init__(self, max_steps: int = 40, price_low: int = 1, price_high: int = 10):
         super().__init__()
         self.price_low = price_low
@@ -19,25 +22,65 @@ class PriceGameEnv(gym.Env):
             "last_prices": spaces.Box(price_low, price_high, shape=(2,), dtype=np.int32)
         })
         self.max_steps = max_steps
+        self._rewards, self._prices = self._lookup_tables()
         self.reset()
 
     def demand(self, average_price: float) -> float:
         return max(0.0, 10.0 - average_price)
 
+    def _lookup_tables(self):
+        """Precompute revenues and price observations for every pair of actions.
+
+        ``step`` then costs two lookups instead of building arrays per tick.
+        The price arrays are read-only because every observation that shows
+        the same prices shares one of them.
+        """
+        prices = range(self.price_low, self.price_high + 1)
+        if len(prices) > self._TABLE_MAX_ACTIONS:
+            return (), ()
+        rewards, arrays = [], []
+        for pa in prices:
+            reward_row, array_row = [], []
+            for pb in prices:
+                d = self.demand((pa + pb) / 2.0)
+                reward_row.append((float(pa * d), float(pb * d)))
+                arr = np.array([pa, pb], dtype=np.int32)
+                arr.setflags(write=False)
+                array_row.append(arr)
+            rewards.append(tuple(reward_row))
+            arrays.append(tuple(array_row))
+        return tuple(rewards), tuple(arrays)
+
+    def _revenue(self, prices) -> tuple:
+        """Revenue for arbitrary prices, used for actions outside the table."""
+        d = self.demand(float(prices.mean()))
+        rev = prices * d
+        return float(rev[0]), float(rev[1])
+
     def reset(self, *, seed=None, options=None):
         super().reset(seed=seed)
         self.t = 0
-        self.state = {"last_prices": np.array([self.price_low, self.price_low], dtype=np.int32)}
+        if self._prices:
+            self.state = {"last_prices": self._prices[0][0]}
+        else:
+            self.state = {"last_prices": np.array([self.price_low, self.price_low], dtype=np.int32)}
         return self.state.copy(), {}
 
     def step(self, actions):
-        prices = np.array([
-            actions["firm_a"] + self.price_low,
-            actions["firm_b"] + self.price_low], dtype=np.int32)
-        self.state["last_prices"] = prices
-        d = self.demand(float(prices.mean()))
-        rev = prices * d
-        reward = {"firm_a": float(rev[0]), "firm_b": float(rev[1])}
+        a, b = actions["firm_a"], actions["firm_b"]
+        n = len(self._rewards)
+        try:
+            in_table = 0 <= a < n and 0 <= b < n
+            if in_table:
+                rev = self._rewards[a][b]
+                self.state["last_prices"] = self._prices[a][b]
+        except TypeError:  # non-integer actions
+            in_table = False
+        if not in_table:
+            prices = np.array([a + self.price_low, b + self.price_low], dtype=np.int32)
+            self.state["last_prices"] = prices
+            rev = self._revenue(prices)
+        reward = {"firm_a": rev[0], "firm_b": rev[1]}
         self.t += 1
         terminated = self.t >= self.max_steps
         return self.state.copy(), reward, terminated, False, {}
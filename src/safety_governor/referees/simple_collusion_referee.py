@@ -1,19 +1,42 @@
 
 """Referee that detects sustained high prices (tacit collusion)."""
+from collections import deque
+import numpy as np
 from ..utils import event_bus
 
+# Below this many agents the plain loop beats NumPy's per-call overhead
+_VECTORIZE_MIN_AGENTS = 8
+
 class SimpleCollusionReferee:
     def __init__(self, threshold: int = 8, window: int = 4):
         self.th = threshold
+        self._limit = threshold - 1  # actions are offset by one from prices
         self.window = window
-        self.buffer = []
+        self.buffer = deque(maxlen=window)
+        self._high_count = 0  # number of True entries currently in buffer
+
+    def reset(self):
+        """Forget the price history, e.g. between episodes."""
+        self.buffer.clear()
+        self._high_count = 0
 
     def inspect(self, actions):
-        high = all(v + 1 >= self.th for v in actions.values())  # +1 because discrete offset
+        if len(actions) >= _VECTORIZE_MIN_AGENTS:
+            vals = np.fromiter(actions.values(), dtype=np.int64, count=len(actions))
+            high = bool((vals >= self._limit).all())
+        else:
+            high = True
+            limit = self._limit
+            for v in actions.values():
+                if v < limit:  # one competitive price is enough, stop early
+                    high = False
+                    break
+        if len(self.buffer) == self.window:
+            # deque(maxlen) drops the oldest entry on append; keep the count in sync
+            self._high_count -= self.buffer[0]
         self.buffer.append(high)
-        if len(self.buffer) > self.window:
-            self.buffer.pop(0)
-        if len(self.buffer) == self.window and all(self.buffer):
+        self._high_count += high
+        if self._high_count == self.window:
             event_bus.publish("alert", {"type": "tacit_collusion", "prices": actions})
             return True
         return False
@@ -1,6 +1,8 @@
 """Utility modules for the safety governor system."""
+from . import aio
 from . import event_bus
-from .llm_client import LLMClient
+from .llm_client import LLMClient, get_client
 from . import prompt_templates
+from .response_cache import ResponseCache
 
-__all__ = ["event_bus", "LLMClient", "prompt_templates"]
\ No newline at end of file
+__all__ = ["aio", "event_bus", "LLMClient", "get_client", "prompt_templates", "ResponseCache"]
\ No newline at end of file
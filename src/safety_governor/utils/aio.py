@@ -0,0 +1,21 @@
+"""Event loop helpers shared by the orchestrator and agent adapters."""
+import asyncio
+
+try:
+    import uvloop  # type: ignore
+except ImportError:  # optional speedup, see the "perf" extra
+    uvloop = None
+
+
+def new_event_loop(prefer_uvloop: bool = True) -> asyncio.AbstractEventLoop:
+    """Create a new event loop, backed by uvloop when it is installed.
+
+    Only loops created here are affected; the process-wide event loop policy
+    is left alone so applications embedding the package keep their own.
+
+    Args:
+        prefer_uvloop: Set to False to always get a stock asyncio loop.
+    """
+    if prefer_uvloop and uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
@@ -1,6 +1,6 @@
 """Synchronous pub/sub event bus used by referees & governor."""
 import logging
-from typing import Callable, Any, Dict, List, Optional
+from typing import Callable, Any, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +45,30 @@ def publish(event_type: str, payload: Any) -> None:
         return
         
     logger.debug(f"Publishing event '{event_type}' to {len(handlers)} handlers")
-    
+    _deliver(event_type, payload, handlers)
+
+def publish_batch(events: Iterable[Tuple[str, Any]]) -> None:
+    """Publish several ``(event_type, payload)`` events in order.
+
+    Handlers are still called once per event with ``(event_type, payload)``.
+    Collecting a step's events and publishing them together skips validation
+    and lookups for event types nobody listens to, and costs nothing at all
+    while no handlers are registered.
+
+    Args:
+        events: The events to publish, in delivery order
+    """
+    if not _subs:
+        return
+    for event_type, payload in events:
+        if not event_type:
+            raise ValueError("Event type cannot be empty")
+        handlers = _subs.get(event_type)
+        if handlers:
+            _deliver(event_type, payload, handlers)
+
+def _deliver(event_type: str, payload: Any, handlers: List[Callable[[str, Any], None]]) -> None:
+    """Call every handler for one event, honouring retries and error settings."""
     failed_handlers = []
     for handler in handlers:
         retries = 0
@@ -2,8 +2,16 @@
 from __future__ import annotations
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional, Union
 import os
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Returned by every provider when a request fails
+FALLBACK_RESPONSE = '{"action": 0}'
 
 
 class LLMClient:
@@ -16,21 +24,50 @@ class LLMClient:
         self.api_key = config.get("api_key", os.getenv(f"{self.provider.upper()}_API_KEY"))
         self.temperature = config.get("temperature", 0.7)
         self.max_tokens = config.get("max_tokens", 150)
-        
+        # Created on first use and reused so repeated calls keep their connections alive
+        self._session: Optional[requests.Session] = None
+        self._sdk_client: Any = None
+
     def generate(self, prompt: str) -> str:
         """Generate response from LLM"""
-        if self.provider == "ollama":
-            return self._ollama_generate(prompt)
-        elif self.provider == "openai":
-            return self._openai_generate(prompt)
-        elif self.provider == "anthropic":
-            return self._anthropic_generate(prompt)
-        elif self.provider == "fireworks":
-            return self._fireworks_generate(prompt)
-        else:
-            raise ValueError(f"Unknown provider: {self.provider}")
+        return self._request(prompt)
     
-    def _ollama_generate(self, prompt: str) -> str:
+    def generate_json(self, prompt: str) -> Any:
+        """Generate a response and return it already decoded from JSON.
+
+        Ollama and OpenAI are asked for JSON output directly, so the reply
+        needs no text extraction. Other providers, failed requests and replies
+        that do not decode are returned as the raw string, which callers
+        should parse as they would a ``generate`` reply.
+        """
+        if self.provider not in self._JSON_MODE_PROVIDERS:
+            return self.generate(prompt)
+        reply = self._request(prompt, json_mode=True)
+        if reply == FALLBACK_RESPONSE:
+            return reply
+        try:
+            return json.loads(reply)
+        except (TypeError, ValueError):
+            return reply
+
+    def _request(self, prompt: str, json_mode: bool = False) -> str:
+        """Dispatch one request to the configured provider."""
+        handler = self._PROVIDERS.get(self.provider)
+        if handler is None:
+            raise ValueError(f"Unknown provider: {self.provider}")
+        return handler(self, prompt, json_mode)
+
+    def _http(self) -> requests.Session:
+        """HTTP session with a small keep-alive pool shared by all calls."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def _ollama_generate(self, prompt: str, json_mode: bool = False) -> str:
         """Generate using Ollama API"""
         url = f"{self.api_base}/api/generate"
         payload = {
@@ -39,37 +76,47 @@ class LLMClient:
             "temperature": self.temperature,
             "stream": False
         }
+        if json_mode:
+            payload["format"] = "json"
         
         try:
-            response = requests.post(url, json=payload)
+            response = self._http().post(url, json=payload)
             response.raise_for_status()
             return response.json()["response"]
         except Exception as e:
-            print(f"Ollama API error: {e}")
-            return '{"action": 0}'  # Default fallback
+            logger.error("Ollama API error: %s", e)
+            return FALLBACK_RESPONSE
     
-    def _openai_generate(self, prompt: str) -> str:
+    def _openai_generate(self, prompt: str, json_mode: bool = False) -> str:
         """Generate using OpenAI API"""
         import openai
+
+        # OpenAI rejects JSON mode unless the prompt itself mentions JSON
+        json_mode = json_mode and "json" in prompt.lower()
         
-        client = openai.OpenAI(api_key=self.api_key)
+        if self._sdk_client is None:
+            self._sdk_client = openai.OpenAI(api_key=self.api_key)
+        client = self._sdk_client
         try:
             response = client.chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=self.temperature,
-                max_tokens=self.max_tokens
+                max_tokens=self.max_tokens,
+                **({"response_format": {"type": "json_object"}} if json_mode else {})
             )
             return response.choices[0].message.content
         except Exception as e:
-            print(f"OpenAI API error: {e}")
-            return '{"action": 0}'
+            logger.error("OpenAI API error: %s", e)
+            return FALLBACK_RESPONSE
     
-    def _anthropic_generate(self, prompt: str) -> str:
+    def _anthropic_generate(self, prompt: str, json_mode: bool = False) -> str:
         """Generate using Anthropic API"""
         import anthropic
         
-        client = anthropic.Anthropic(api_key=self.api_key)
+        if self._sdk_client is None:
+            self._sdk_client = anthropic.Anthropic(api_key=self.api_key)
+        client = self._sdk_client
         try:
             response = client.messages.create(
                 model=self.model,
@@ -79,10 +126,10 @@ class LLMClient:
             )
             return response.content[0].text
         except Exception as e:
-            print(f"Anthropic API error: {e}")
-            return '{"action": 0}'
+            logger.error("Anthropic API error: %s", e)
+            return FALLBACK_RESPONSE
     
-    def _fireworks_generate(self, prompt: str) -> str:
+    def _fireworks_generate(self, prompt: str, json_mode: bool = False) -> str:
         """Generate using Fireworks API"""
         url = "https://api.fireworks.ai/inference/v1/completions"
         headers = {
@@ -97,9 +144,41 @@ class LLMClient:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = self._http().post(url, headers=headers, json=payload)
             response.raise_for_status()
             return response.json()["choices"][0]["text"]
         except Exception as e:
-            print(f"Fireworks API error: {e}")
-            return '{"action": 0}'
\ No newline at end of file
+            logger.error("Fireworks API error: %s", e)
+            return FALLBACK_RESPONSE
+
+    # Provider name -> request function; json_mode is ignored by providers
+    # without a native JSON output mode
+    _PROVIDERS = {
+        "ollama": _ollama_generate,
+        "openai": _openai_generate,
+        "anthropic": _anthropic_generate,
+        "fireworks": _fireworks_generate,
+    }
+    _JSON_MODE_PROVIDERS = frozenset({"ollama", "openai"})
+
+# Clients shared by every caller with an identical config
+_CLIENTS: Dict[Any, LLMClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _config_key(config: Dict[str, Any]) -> Any:
+    return tuple(sorted((k, repr(v)) for k, v in config.items()))
+
+
+def get_client(config: Dict[str, Any]) -> LLMClient:
+    """Return a shared LLMClient for ``config``.
+
+    Agents that talk to the same provider, model and endpoint with the same
+    settings reuse one client, and with it one HTTP connection pool.
+    """
+    key = _config_key(config)
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = _CLIENTS[key] = LLMClient(config)
+        return client
@@ -1,5 +1,10 @@
 """Prompt templates for different game environments."""
-from typing import Dict, Any
+import functools
+import logging
+import string
+from typing import Callable, Dict, Any, FrozenSet, Set
+
+logger = logging.getLogger(__name__)
 
 # Default prompt templates for different game types
 PROMPT_TEMPLATES = {
@@ -72,6 +77,42 @@ Reply with ONLY a JSON object in this format: {{"action": <number>}}"""
 }
 
 
+# Names accepted by get_prompt_template
+GAME_TYPES: FrozenSet[str] = frozenset(PROMPT_TEMPLATES)
+
+# Fallback values for placeholders missing from an observation
+_PROMPT_DEFAULTS: Dict[str, Any] = {
+    "my_last_price": 5,
+    "opponent_last_price": 5,
+    "last_profits": [0, 0],
+    "round_num": 0,
+    "available_resources": 100,
+    "my_last_extraction": 0,
+    "others_avg_extraction": 0,
+    "item_value": 50,
+    "last_winning_bid": 0,
+    "budget_remaining": 100,
+    "role": "player",
+    "amount_received": 0,
+    "trust_history": []
+}
+
+# Placeholders we already warned about, so each is reported only once
+_warned_missing: Set[str] = set()
+
+
+class _PromptData(dict):
+    """Prompt data that falls back to _PROMPT_DEFAULTS for missing keys."""
+
+    def __missing__(self, key: str) -> Any:
+        if key not in _PROMPT_DEFAULTS:
+            raise KeyError(key)
+        if key not in _warned_missing:
+            _warned_missing.add(key)
+            logger.warning("Missing prompt data for '%s', using defaults", key)
+        return _PROMPT_DEFAULTS[key]
+
+
 def get_prompt_template(game_type: str) -> str:
     """Get the default prompt template for a game type."""
     return PROMPT_TEMPLATES.get(game_type, PROMPT_TEMPLATES["price_game"])
@@ -89,6 +130,54 @@ def format_prompt(template: str, observation: Dict[str, Any],
     Returns:
         Formatted prompt string
     """
+    return compile_prompt(template)(observation, agent_index)
+
+
+@functools.lru_cache(maxsize=32)
+def compile_prompt(template: str) -> Callable[[Dict[str, Any], int], str]:
+    """Pre-parse a prompt template into a reusable formatting function.
+    
+    The template's placeholder names are extracted once, so each call only
+    copies the observation fields the template actually uses.
+    
+    Args:
+        template: The prompt template string with {placeholders}
+        
+    Returns:
+        A function ``(observation, agent_index) -> str`` equivalent to
+        ``format_prompt(template, observation, agent_index)``
+    """
+    fields = frozenset(
+        _field_root(name)
+        for _, name, _, _ in string.Formatter().parse(template)
+        if name
+    )
+    render = template.format_map
+
+    def format_observation(observation: Dict[str, Any], agent_index: int = 0) -> str:
+        prompt_data = _prompt_data(observation, agent_index, fields)
+        # Format the template in a single pass; placeholders the observation does
+        # not provide are filled from _PROMPT_DEFAULTS by _PromptData.__missing__
+        try:
+            return render(_PromptData(prompt_data))
+        except KeyError as e:
+            logger.error("Still missing %s after defaults", e)
+            return f"Error formatting prompt: {e}"
+
+    return format_observation
+
+
+def _field_root(name: str) -> str:
+    """Top-level key of a format field, e.g. 'a' for 'a.b' or 'a[0]'."""
+    for i, ch in enumerate(name):
+        if ch in ".[":
+            return name[:i]
+    return name
+
+
+def _prompt_data(observation: Dict[str, Any], agent_index: int,
+                 fields: FrozenSet[str]) -> Dict[str, Any]:
+    """Collect placeholder values from an observation."""
     # Extract common fields
     prompt_data = {
         "round_num": observation.get("current_step", 0),
@@ -130,44 +219,12 @@ def format_prompt(template: str, observation: Dict[str, Any],
         prompt_data["amount_received"] = observation.get("amount_received", 0)
         prompt_data["trust_history"] = observation.get("trust_history", [])
     
-    # Add any additional fields from observation
-    for key, value in observation.items():
-        if key not in prompt_data:
-            prompt_data[key] = value
+    # Add any other observation fields the template refers to
+    for key in fields:
+        if key not in prompt_data and key in observation:
+            prompt_data[key] = observation[key]
             
-    # Format the template - use format_map for partial formatting
-    try:
-        # First try with all available data
-        return template.format(**prompt_data)
-    except KeyError as e:
-        # If some placeholders are missing, provide defaults
-        print(f"Warning: Missing prompt data for {e}, using defaults")
-        
-        # Add common defaults
-        defaults = {
-            "my_last_price": 5,
-            "opponent_last_price": 5,
-            "last_profits": [0, 0],
-            "round_num": 0,
-            "available_resources": 100,
-            "my_last_extraction": 0,
-            "others_avg_extraction": 0,
-            "item_value": 50,
-            "last_winning_bid": 0,
-            "budget_remaining": 100,
-            "role": "player",
-            "amount_received": 0,
-            "trust_history": []
-        }
-        
-        # Merge with existing data
-        full_data = {**defaults, **prompt_data}
-        
-        try:
-            return template.format(**full_data)
-        except KeyError as e2:
-            print(f"Error: Still missing {e2} after defaults")
-            return f"Error formatting prompt: {e2}"
+    return prompt_data
 
 
 # Prompt processors for extracting agent-specific information
@@ -0,0 +1,77 @@
+"""Bounded LRU cache for deterministic LLM responses."""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+try:
+    import xxhash  # type: ignore
+except ImportError:  # optional speedup, see the "perf" extra
+    xxhash = None
+
+
+class ResponseCache:
+    """Thread-safe LRU mapping from prompt keys to parsed responses.
+
+    Only use this for deterministic generations (temperature 0): a cached
+    entry is returned instead of calling the model again.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> int:
+        """Build a stable 128-bit integer key from the parts that determine a response.
+
+        Keys only need to be collision resistant, not cryptographic, so xxh3 is
+        used when available; blake2b is the stdlib fallback. Integer keys hash
+        and compare faster than hex strings.
+        """
+        data = "\x1f".join(str(p) for p in parts).encode("utf-8")
+        if xxhash is not None:
+            return xxhash.xxh3_128_intdigest(data)
+        return int.from_bytes(hashlib.blake2b(data, digest_size=16).digest(), "big")
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for ``key`` and mark it most recently used."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value``, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+"""Tests for the synchronous event bus."""
+
+import pytest
+
+from safety_governor.utils import event_bus
+
+
+@pytest.fixture
+def received():
+    """Record (event_type, payload) pairs delivered to alert and step handlers."""
+    events = []
+
+    def handler(event_type, payload):
+        events.append((event_type, payload))
+
+    event_bus.subscribe("alert", handler)
+    event_bus.subscribe("step", handler)
+    yield events
+    event_bus.unsubscribe("alert", handler)
+    event_bus.unsubscribe("step", handler)
+
+
+def test_publish_batch_order(received):
+    """Test that batched events reach handlers one by one, in order."""
+    event_bus.publish_batch([("step", 1), ("unheard", 2), ("alert", 3), ("step", 4)])
+    assert received == [("step", 1), ("alert", 3), ("step", 4)]
+
+
+def test_publish_batch_errors(received):
+    """Test that batches honour handler error settings like publish."""
+    def failing(event_type, payload):
+        raise RuntimeError("boom")
+
+    event_bus.subscribe("alert", failing)
+    event_bus.configure(fail_on_handler_error=True)
+    try:
+        with pytest.raises(RuntimeError, match="boom"):
+            event_bus.publish_batch([("step", 1), ("alert", 2), ("step", 3)])
+        assert received == [("step", 1), ("alert", 2)]
+        with pytest.raises(ValueError):
+            event_bus.publish_batch([("", None)])
+    finally:
+        event_bus.configure(fail_on_handler_error=False)
+        event_bus.unsubscribe("alert", failing)
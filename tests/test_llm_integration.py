@@ -1,9 +1,12 @@
 """Test LLM integration with different providers"""
 import pytest
 import json
-from safety_governor.utils.llm_client import LLMClient
-from safety_governor.adapters.autogen_agent_adapter import AutoGenAgentAdapter
+from safety_governor.utils.llm_client import LLMClient, get_client
+from safety_governor.utils.prompt_templates import get_prompt_template
+from safety_governor.adapters.autogen_agent_adapter import AutoGenAgentAdapter, _jsonable, run_actions_batch
 import autogen
+import asyncio
+from safety_governor.adapters.batching_agent_adapter import BatchingAgentAdapter
 
 
 def test_llm_client_ollama():
@@ -28,6 +31,49 @@ def test_llm_client_ollama():
         assert response == '{"action": 0}'
 
 
+def test_shared_llm_client():
+    """Test that identical LLM configs share a single client"""
+    config = {"provider": "ollama", "model": "qwen3:8b", "temperature": 0}
+    assert get_client(config) is get_client(dict(config))
+    assert get_client(config) is not get_client({**config, "temperature": 0.5})
+
+    adapters = [AutoGenAgentAdapter(autogen.ConversableAgent(name=f"Agent{i}", llm_config=False),
+                                    llm_config=config) for i in range(2)]
+    assert adapters[0].llm_client is adapters[1].llm_client
+
+
+def test_llm_cache_switch(monkeypatch):
+    """Test that enable_cache is the single switch for caching LLM replies"""
+    AutoGenAgentAdapter._RESPONSE_CACHE.clear()
+    calls = []
+
+    def fake_request(self, prompt, json_mode=False):
+        calls.append(self.api_base)
+        return '{"action": 3}'
+
+    monkeypatch.setattr(LLMClient, "_request", fake_request)
+    observation = {"last_prices": [2, 3], "current_step": 1}
+
+    def make(enable_cache, api_base="http://a"):
+        adapter = AutoGenAgentAdapter(autogen.ConversableAgent(name="Agent", llm_config=False),
+                                      name="agent", enable_cache=enable_cache)
+        adapter.llm_client = LLMClient({"provider": "ollama", "model": "m",
+                                        "temperature": 0, "api_base": api_base})
+        return adapter
+
+    uncached = make(enable_cache=False)
+    assert [uncached.act(observation) for _ in range(3)] == [3, 3, 3]
+    assert len(calls) == 3
+
+    cached = make(enable_cache=True)
+    cached.act(observation)
+    cached.act(observation)
+    assert len(calls) == 4
+    # The same model behind another endpoint does not share answers
+    make(enable_cache=True, api_base="http://b").act(observation)
+    assert calls[-1] == "http://b" and len(calls) == 5
+
+
 def test_autogen_adapter_with_llm():
     """Test AutoGenAgentAdapter with LLM configuration"""
     # Create a mock AutoGen agent with LLM config
@@ -103,5 +149,248 @@ def test_prompt_formatting():
         assert 0 <= action <= 9
 
 
+def test_mock_behaviors():
+    """Test that mock behaviors return their configured actions"""
+    agent = autogen.ConversableAgent(name="TestAgent", llm_config=False)
+    observation = {"last_prices": [3, 8], "opponent_last_price": 7, "round_num": 4}
+
+    cases = [
+        ("always_low", 0),
+        ("always_high", 9),
+        ("always_medium", 5),
+        ("tit_for_tat", 7),
+        ({"type": "fixed", "action": 3}, 3),
+        ({"type": "pattern", "pattern": [1, 2, 3]}, 2),
+        ({"type": "conditional",
+          "conditions": [{"field": "opponent_last_price", "operator": ">", "value": 5, "action": 8}],
+          "default_action": 1}, 8),
+        ({"type": "conditional",
+          "conditions": [{"field": "missing", "operator": "==", "value": 1, "action": 8},
+                         {"field": "round_num", "operator": "!=", "value": 1, "action": 8}],
+          "default_action": 1}, 1),
+    ]
+    for behavior, expected in cases:
+        adapter = AutoGenAgentAdapter(agent, name="test_agent", mock_behavior=behavior)
+        assert adapter.act(observation) == expected
+
+
+def test_random_mock_reset():
+    """Test that the random mock behavior is reproducible per seed"""
+    agent = autogen.ConversableAgent(name="TestAgent", llm_config=False)
+    adapter = AutoGenAgentAdapter(agent, name="test_agent", mock_behavior="random")
+    observation = {"last_prices": [2, 3], "current_step": 1}
+
+    adapter.reset(7)
+    first = [adapter.act(observation) for _ in range(10)]
+    adapter.reset(7)
+    assert [adapter.act(observation) for _ in range(10)] == first
+    assert all(0 <= a <= 9 for a in first)
+
+
+class _CountingClient:
+    """Minimal stand-in for LLMClient that counts generate() calls"""
+    provider = "stub"
+    model = "stub-model"
+
+    def __init__(self, temperature=0.0, reply='{"action": 4}'):
+        self.temperature = temperature
+        self.reply = reply
+        self.calls = 0
+
+    def generate(self, prompt):
+        self.calls += 1
+        return self.reply
+
+
+def test_response_cache_deterministic():
+    """Test that temperature-0 responses are served from the cache"""
+    AutoGenAgentAdapter._RESPONSE_CACHE.clear()
+    agent = autogen.ConversableAgent(name="TestAgent", llm_config=False)
+    adapter = AutoGenAgentAdapter(agent, name="test_agent")
+    adapter.llm_client = _CountingClient(temperature=0)
+
+    observation = {"last_prices": [5, 7], "current_step": 3}
+    assert adapter.act(observation) == 4
+    assert adapter.act(observation) == 4
+    assert adapter.llm_client.calls == 1
+    assert AutoGenAgentAdapter.cache_stats()["hits"] == 1
+
+
+def test_response_cache_skipped():
+    """Test that sampling temperatures and failed requests bypass the cache"""
+    AutoGenAgentAdapter._RESPONSE_CACHE.clear()
+    agent = autogen.ConversableAgent(name="TestAgent", llm_config=False)
+    observation = {"last_prices": [2, 3], "current_step": 1}
+
+    adapter = AutoGenAgentAdapter(agent, name="test_agent")
+    adapter.llm_client = _CountingClient(temperature=0.7)
+    adapter.act(observation)
+    adapter.act(observation)
+    assert adapter.llm_client.calls == 2
+
+    adapter.llm_client = _CountingClient(temperature=0, reply='{"action": 0}')
+    adapter.act(observation)
+    adapter.act(observation)
+    assert adapter.llm_client.calls == 2
+    assert len(AutoGenAgentAdapter._RESPONSE_CACHE) == 0
+
+
+
+def test_prompt_template_by_game_type():
+    """Test that prompt_template accepts the name of a built-in game type"""
+    agent = autogen.ConversableAgent(name="TestAgent", llm_config=False)
+    adapter = AutoGenAgentAdapter(agent, name="test_agent", prompt_template="commons_game")
+    assert adapter.prompt_template == get_prompt_template("commons_game")
+
+    adapter.prompt_template = "Round {round_num}"
+    adapter.llm_client = _CountingClient(reply="3")
+    prompts = []
+    adapter.llm_client.generate = lambda prompt: prompts.append(prompt) or "3"
+    assert adapter.act({"current_step": 4}) == 3
+    assert prompts == ["Round 4"]
+
+
+def test_jsonable_observation():
+    """Test that only observations holding numpy values are copied"""
+    import numpy as np
+    plain = {"last_prices": [2, 3], "meta": {"round": 1}}
+    assert _jsonable(plain) is plain
+
+    observation = {"last_prices": np.array([2, 3]), "meta": {"round": np.int64(1)}, "tag": "x"}
+    converted = _jsonable(observation)
+    assert converted == {"last_prices": [2, 3], "meta": {"round": 1}, "tag": "x"}
+    assert type(converted["meta"]["round"]) is int
+    assert isinstance(observation["last_prices"], np.ndarray)
+
+
+def test_generate_json_reply():
+    """Test that decoded replies from generate_json skip text parsing"""
+    agent = autogen.ConversableAgent(name="TestAgent", llm_config=False)
+    adapter = AutoGenAgentAdapter(agent, name="test_agent", enable_cache=False)
+    adapter.llm_client = _CountingClient()
+    adapter.llm_client.generate_json = lambda prompt: {"action": 6}
+    assert adapter.act({"last_prices": [2, 3], "current_step": 1}) == 6
+    assert adapter.llm_client.calls == 0
+
+
+def test_inject_info():
+    """Test that info is only extended when inject_info is configured"""
+    agent = autogen.ConversableAgent(name="TestAgent", llm_config=False)
+    seen = []
+    observation = {"last_prices": [2, 3], "current_step": 1}
+
+    adapter = AutoGenAgentAdapter(agent, name="test_agent", mock_behavior="always_low")
+    adapter._mock_fn = lambda obs, info: seen.append(info) or {"action": 0}
+    adapter.act(observation)
+    assert seen == [None]
+
+    adapter.inject_info = {"predicted_opponent_price": "low"}
+    caller_info = {"round": 1}
+    adapter.act(observation, caller_info)
+    assert seen[-1] == {"round": 1, "predicted_opponent_price": "low"}
+    assert caller_info == {"round": 1}
+
+
+def test_reply_parsing():
+    """Test that the JSON payload is extracted from noisy LLM replies"""
+    agent = autogen.ConversableAgent(name="TestAgent", llm_config=False)
+    observation = {"last_prices": [2, 3], "current_step": 1}
+    adapter = AutoGenAgentAdapter(agent, name="test_agent", enable_cache=False)
+
+    for reply, expected in [('Sure!\n{"action": 7}\nGood luck.', 7),
+                            (b'{"action": 3}', 3),
+                            ('  6\n', 6),
+                            ('no json here', 0)]:
+        adapter.llm_client = _CountingClient(reply=reply)
+        assert adapter.act(observation) == expected
+
+
+
+class _BatchClient(_CountingClient):
+    """Stub that answers batched prompts with one action per request"""
+
+    def generate(self, prompt):
+        self.calls += 1
+        if self.reply is not None and "independent requests" in prompt:
+            return self.reply
+        return '{"action": 2}'
+
+
+def _act_together(adapters, observation):
+    async def _run():
+        return await asyncio.gather(*(a.act_async(observation) for a in adapters))
+    return asyncio.run(_run())
+
+
+def _batching_adapters(client, episodes, **kwargs):
+    adapters = []
+    for i, episode in enumerate(episodes):
+        agent = autogen.ConversableAgent(name=f"Agent{i}", llm_config=False)
+        adapter = BatchingAgentAdapter(agent, name=f"agent_{i}", agent_index=i,
+                                       enable_cache=False, **kwargs)
+        adapter.llm_client = client
+        adapter.reset(episode)
+        adapters.append(adapter)
+    return adapters
+
+
+def test_batching_adapter():
+    """Test that agents of different episodes share one LLM call per step"""
+    client = _BatchClient(reply='{"actions": [1, 5, 8]}')
+    adapters = _batching_adapters(client, episodes=[0, 1, 2])
+
+    observation = {"last_prices": [2, 3, 4], "current_step": 1}
+    assert _act_together(adapters, observation) == [1, 5, 8]
+    assert client.calls == 1
+
+    # A reply that does not match the batch falls back to one call per agent
+    client.reply = '{"actions": [1]}'
+    assert _act_together(adapters, observation) == [2, 2, 2]
+    assert client.calls == 5
+
+    with pytest.raises(ValueError):
+        BatchingAgentAdapter(autogen.ConversableAgent(name="Bad", llm_config=False), max_batch=0)
+
+
+def test_batching_adapter_same_episode():
+    """Test that agents of one episode are never fused into one request"""
+    client = _BatchClient(reply='{"actions": [1, 5, 8]}')
+    adapters = _batching_adapters(client, episodes=[7, 7, 8])
+    observation = {"last_prices": [2, 3, 4], "current_step": 1}
+    assert _act_together(adapters, observation) == [2, 2, 2]
+    assert client.calls == 2  # firms of episode 7 in separate batches, 8 joins one
+
+    client.calls = 0
+    assert asyncio.run(BatchingAgentAdapter.batch_act_async(adapters[:2], [observation] * 2)) == [2, 2]
+    assert client.calls == 2
+
+
+def test_batch_act_async_flushes_immediately():
+    """Test that batch_act_async does not wait out max_wait_ms"""
+    import time
+    client = _BatchClient(reply='{"actions": [3, 4]}')
+    adapters = _batching_adapters(client, episodes=[0, 1], max_wait_ms=5000)
+
+    observation = {"last_prices": [2, 3], "current_step": 1}
+    start = time.monotonic()
+    actions = asyncio.run(BatchingAgentAdapter.batch_act_async(adapters, [observation] * 2))
+    assert actions == [3, 4]
+    assert client.calls == 1
+    assert time.monotonic() - start < 1.0
+
+
+def test_run_actions_batch():
+    """Test acting with several adapters on the shared per-thread loop"""
+    adapters = [
+        AutoGenAgentAdapter(autogen.ConversableAgent(name=f"Agent{i}", llm_config=False),
+                            name=f"agent_{i}", mock_behavior=behavior)
+        for i, behavior in enumerate(["always_low", "always_high", "always_medium"])
+    ]
+    observation = {"last_prices": [2, 3], "current_step": 1}
+    assert run_actions_batch(adapters, [observation] * 3) == [0, 9, 5]
+    # The synchronous path keeps working on the same loop
+    assert adapters[1].act(observation) == 9
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
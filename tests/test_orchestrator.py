@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 """Integration tests for the orchestrator module."""
 
+import asyncio
 import os
 import sys
 import pytest
@@ -10,7 +11,7 @@ import yaml
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from safety_governor.core.orchestrator import Orchestrator, load, main
+from safety_governor.core.orchestrator import Orchestrator, load, load_config, main
 
 
 class TestLoad:
@@ -35,6 +36,64 @@ class TestLoad:
         """Test loading a non-existent class from valid module."""
         with pytest.raises(AttributeError):
             load("safety_governor.core.orchestrator:NonExistentClass")
+    
+    def test_load_config(self, tmp_path):
+        """Test that configs are cached per file version and copied per call."""
+        path = tmp_path / "cfg.yaml"
+        path.write_text("seeds: 0-1\nagents: [{id: a}]\n")
+        cfg = load_config(str(path))
+        assert cfg == {'seeds': '0-1', 'agents': [{'id': 'a'}]}
+        
+        cfg['agents'][0]['id'] = 'changed'
+        assert load_config(str(path))['agents'][0]['id'] == 'a'
+        
+        path.write_text("seeds: 3\n")
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+        assert load_config(str(path)) == {'seeds': 3}
+
+
+class AsyncInspectDefense:
+    """Defense with an async inspection hook, used by the defense tests."""
+    active = 0
+    peak = 0
+
+    def __init__(self):
+        self.seen = []
+        self.intervened = 0
+
+    async def ainspect(self, actions):
+        cls = AsyncInspectDefense
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        await asyncio.sleep(0.01)
+        cls.active -= 1
+        self.seen.append(dict(actions))
+
+    def inspect(self, actions):
+        raise AssertionError("ainspect should be preferred")
+
+    def intervene(self, env):
+        self.intervened += 1
+
+
+def _eager_task_factory(loop, coro, **kwargs):
+    """Stand-in for asyncio.eager_task_factory on Python < 3.12.
+
+    Agent coroutines are run to completion synchronously, as eager tasks do
+    for coroutines that never suspend; everything else becomes a normal task.
+    """
+    if not coro.__qualname__.endswith('act_async'):
+        return asyncio.Task(coro, loop=loop, **kwargs)
+    fut = loop.create_future()
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        fut.set_result(stop.value)
+    except Exception as e:
+        fut.set_exception(e)
+    else:
+        raise AssertionError("agent coroutine suspended")
+    return fut
 
 
 class TestOrchestrator:
@@ -101,6 +160,14 @@ class TestOrchestrator:
         assert agents['firm_a'].__class__.__name__ == 'AutoGenAgentAdapter'
         assert agents['firm_b'].__class__.__name__ == 'AutoGenAgentAdapter'
     
+    def test_make_agents_preserves_config(self, valid_config):
+        """Test that building agents does not consume the configuration."""
+        orch = Orchestrator(valid_config)
+        orch._make_agents()
+        agents = orch._make_agents()
+        assert set(agents) == {'firm_a', 'firm_b'}
+        assert valid_config['agents'][0]['params']['autogen_agent']['_factory'] == 'autogen.ConversableAgent'
+    
     def test_make_agents_missing_config(self):
         """Test agent creation with missing agents config."""
         config = {'base_env': 'PriceGame-v0', 'seeds': [42]}
@@ -118,6 +185,116 @@ class TestOrchestrator:
         assert isinstance(result['firm_a'], (int, float))
         assert isinstance(result['firm_b'], (int, float))
     
+    def test_run_seed_without_uvloop(self, valid_config):
+        """Test that use_uvloop: false runs on a stock asyncio loop."""
+        orch = Orchestrator({**valid_config, 'use_uvloop': False})
+        loop = orch._new_loop()
+        try:
+            assert type(loop).__module__.startswith('asyncio')
+        finally:
+            loop.close()
+        assert set(orch.run_seed(42)) == {'firm_a', 'firm_b'}
+
+    def test_eager_task_factory(self, valid_config):
+        """Test that run loops use eager tasks where asyncio supports them."""
+        eager = getattr(asyncio, 'eager_task_factory', None)
+        for enabled in (True, False):
+            loop = Orchestrator({**valid_config, 'eager_tasks': enabled})._new_loop()
+            try:
+                assert loop.get_task_factory() is (eager if enabled else None)
+            finally:
+                loop.close()
+
+    def test_run_seed_inside_running_loop(self, valid_config):
+        """Test that runs started from async code fail with a clear error."""
+        orch = Orchestrator(valid_config)
+
+        async def _run():
+            with pytest.raises(RuntimeError, match="running event loop"):
+                orch.run_seed(42)
+            with pytest.raises(RuntimeError, match="running event loop"):
+                next(orch.run_seed_stream(42))
+            return await asyncio.get_running_loop().run_in_executor(None, orch.run_seed, 42)
+
+        assert set(asyncio.run(_run())) == {'firm_a', 'firm_b'}
+
+    def test_async_defense_inspections(self, valid_config):
+        """Test that async defense inspections of a step run concurrently."""
+        valid_config['defenses'] = [
+            {'id': f'd{i}', 'impl': f'{__name__}:AsyncInspectDefense'} for i in range(3)
+        ]
+        orch = Orchestrator(valid_config)
+        orch.run_seed(42)
+        steps = orch._env.max_steps
+        for defense in orch._defenses.values():
+            assert len(defense.seen) == steps
+            assert defense.intervened == steps
+        assert AsyncInspectDefense.peak == 3
+
+    def test_collect_actions_eager_tasks(self, valid_config):
+        """Test that actions finished at task creation are collected correctly."""
+        class ImmediateAgent:
+            def __init__(self, action):
+                self.action = action
+
+            async def act_async(self, obs, info=None):
+                if self.action is None:
+                    raise RuntimeError("boom")
+                return self.action
+
+        factory = getattr(asyncio, 'eager_task_factory', _eager_task_factory)
+        for fail_fast in (True, False):
+            valid_config['fail_fast'] = fail_fast
+            orch = Orchestrator(valid_config)
+            loop = orch._new_loop()
+            loop.set_task_factory(factory)
+            try:
+                acts = loop.run_until_complete(
+                    orch._collect_actions({'a': ImmediateAgent(9), 'b': ImmediateAgent(0)}, {}))
+                assert acts == {'a': 9, 'b': 0}
+                failing = orch._collect_actions({'a': ImmediateAgent(9), 'b': ImmediateAgent(None)}, {})
+                if fail_fast:
+                    with pytest.raises(RuntimeError, match="boom"):
+                        loop.run_until_complete(failing)
+                else:
+                    assert loop.run_until_complete(failing) == {'a': 9, 'b': {'action': 0}}
+            finally:
+                loop.close()
+
+    def test_components_built_once(self, valid_config):
+        """Test that agents and environment are reused across seeds."""
+        orch = Orchestrator(valid_config)
+        first = orch.run_seed(1)
+        env, agents = orch._env, orch._agents
+        orch.run_seed(2)
+        assert orch._env is env
+        assert orch._agents is agents
+        # Resetting with the same seed reproduces the episode
+        assert orch.run_seed(1) == first
+        obs = orch.reset(3)
+        assert orch._env is env
+        assert list(obs['last_prices']) == [1, 1]
+    
+    def test_run_seed_stream(self, valid_config):
+        """Test streamed events and their read-only snapshots."""
+        orch = Orchestrator(valid_config)
+        events = list(orch.run_seed_stream(42))
+        assert events[0]['type'] == 'reset'
+        assert events[-1]['type'] == 'summary'
+        steps = [e for e in events if e['type'] == 'step']
+        assert len(steps) == events[0]['max_steps']
+        # Earlier snapshots are not affected by later steps
+        assert events[0]['total'] == {'firm_a': 0.0, 'firm_b': 0.0}
+        assert dict(events[-1]['total']) == orch.run_seed(42)
+        with pytest.raises(TypeError):
+            steps[0]['total']['firm_a'] = 1.0
+
+        valid_config['stream_copy'] = 'shallow'
+        assert isinstance(next(orch.run_seed_stream(42))['total'], dict)
+        valid_config['stream_copy'] = 'bogus'
+        with pytest.raises(ValueError, match="stream_copy"):
+            next(orch.run_seed_stream(42))
+    
     def test_run_seed_invalid_env(self):
         """Test running with invalid environment."""
         config = {
@@ -150,6 +327,23 @@ class TestOrchestrator:
         results = orch.run()
         assert len(results) == 3
     
+    def test_run_parallel_seeds(self, valid_config):
+        """Test that parallel seeds match the sequential results."""
+        valid_config['seeds'] = '0-5'
+        sequential = Orchestrator(valid_config).run()
+        valid_config['parallel_seeds'] = 2
+        parallel = Orchestrator(valid_config).run()
+        assert parallel == sequential
+    
+    def test_run_iter(self, valid_config):
+        """Test that run_iter streams the same results as run."""
+        valid_config['seeds'] = [1, 2, 3]
+        orch = Orchestrator(valid_config)
+        stream = orch.run_iter()
+        first = next(stream)
+        assert first == Orchestrator(valid_config).run_seed(1)
+        assert [first, *stream] == Orchestrator(valid_config).run()
+    
     def test_run_missing_seeds(self, valid_config):
         """Test running without seeds config."""
         del valid_config['seeds']
@@ -171,6 +365,129 @@ class TestOrchestrator:
         results = orch.run()
         assert len(results) == 0  # Should stop immediately
 
+    def test_collect_actions_concurrent(self, valid_config):
+        """Test that agents are asked for actions concurrently."""
+        import time
+
+        class SlowAgent:
+            def __init__(self, action):
+                self.action = action
+
+            def act(self, obs):
+                time.sleep(0.2)
+                return self.action
+
+        orch = Orchestrator(valid_config)
+        agents = {f"agent_{i}": SlowAgent(i) for i in range(4)}
+        start = time.monotonic()
+        acts = asyncio.run(orch._collect_actions(agents, {}))
+        elapsed = time.monotonic() - start
+        orch.close()
+
+        assert acts == {f"agent_{i}": i for i in range(4)}
+        assert elapsed < 0.6  # Sequential collection would take ~0.8s
+
+    def test_collect_actions_failure(self, valid_config):
+        """Test agent failures honour fail_fast."""
+        class FailingAgent:
+            def act(self, obs):
+                raise RuntimeError("boom")
+
+        orch = Orchestrator(valid_config)
+        with pytest.raises(RuntimeError):
+            asyncio.run(orch._collect_actions({'bad': FailingAgent()}, {}))
+
+        valid_config['fail_fast'] = False
+        assert asyncio.run(orch._collect_actions({'bad': FailingAgent()}, {})) == {'bad': {'action': 0}}
+        orch.close()
+
+    def test_collect_actions_fail_fast_cancels(self, valid_config):
+        """Test that a failing agent cancels agents still waiting on their reply."""
+        cancelled = []
+
+        class SlowAgent:
+            async def act_async(self, obs, info=None):
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+
+        class FailingAgent:
+            async def act_async(self, obs, info=None):
+                raise RuntimeError("boom")
+
+        orch = Orchestrator(valid_config)
+        with pytest.raises(RuntimeError, match="boom"):
+            asyncio.run(orch._collect_actions({'slow': SlowAgent(), 'bad': FailingAgent()}, {}))
+        assert cancelled == [True]
+
+    def test_collect_actions_batched(self, valid_config):
+        """Test that batch_actions hands same-class agents to one batch call."""
+        calls = []
+
+        class BatchAgent:
+            def __init__(self, action):
+                self.action = action
+
+            async def act_async(self, obs, info=None):
+                raise AssertionError("batch_act_async should be preferred")
+
+            @classmethod
+            async def batch_act_async(cls, agents, observations, info=None):
+                calls.append(len(agents))
+                return [a.action for a in agents]
+
+        class SyncAgent:
+            def act(self, obs):
+                return 'sync'
+
+        valid_config['batch_actions'] = True
+        orch = Orchestrator(valid_config)
+        agents = {'a': BatchAgent(1), 'solo': SyncAgent(), 'b': BatchAgent(2)}
+        acts = asyncio.run(orch._collect_actions(agents, {}))
+        orch.close()
+        assert list(acts.items()) == [('a', 1), ('solo', 'sync'), ('b', 2)]
+        assert calls == [2]
+
+    def test_collect_actions_timeout(self, valid_config):
+        """Test that only agents exceeding action_timeout get the default action."""
+        class AsyncAgent:
+            def __init__(self, delay):
+                self.delay = delay
+
+            async def act_async(self, obs, info=None):
+                await asyncio.sleep(self.delay)
+                return self.delay
+
+        valid_config['action_timeout'] = 0.2
+        orch = Orchestrator(valid_config)
+        agents = {'fast': AsyncAgent(0.01), 'slow': AsyncAgent(5)}
+        acts = asyncio.run(orch._collect_actions(agents, {}))
+        assert acts == {'fast': 0.01, 'slow': {'action': 0}}
+
+    def test_collect_actions_async_agents(self, valid_config):
+        """Test that agents with act_async are awaited concurrently."""
+        import time
+
+        class AsyncAgent:
+            def __init__(self, action):
+                self.action = action
+
+            def act(self, obs):
+                raise AssertionError("act_async should be preferred")
+
+            async def act_async(self, obs, info=None):
+                await asyncio.sleep(0.2)
+                return self.action
+
+        orch = Orchestrator(valid_config)
+        agents = {f"agent_{i}": AsyncAgent(i) for i in range(4)}
+        start = time.monotonic()
+        acts = asyncio.run(orch._collect_actions(agents, {}))
+        assert acts == {f"agent_{i}": i for i in range(4)}
+        assert time.monotonic() - start < 0.6
+
 
 class TestErrorScenarios:
     """Test various error scenarios."""
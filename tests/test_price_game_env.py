@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+"""Tests for the price game environment."""
+
+import os
+import sys
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from safety_governor.environments.price_game_env import PriceGameEnv
+
+
+@pytest.mark.parametrize("actions", [
+    {"firm_a": 0, "firm_b": 0},
+    {"firm_a": 3, "firm_b": 7},
+    {"firm_a": np.int64(9), "firm_b": 2},
+    {"firm_a": 12, "firm_b": 1},   # outside the action space
+    {"firm_a": 2.0, "firm_b": 4},  # non-integer action
+])
+def test_step_rewards(actions):
+    """Test that table lookups match the demand formula."""
+    env = PriceGameEnv()
+    obs, reward, terminated, _, _ = env.step(actions)
+    prices = [actions["firm_a"] + 1, actions["firm_b"] + 1]
+    d = max(0.0, 10.0 - sum(prices) / 2.0)
+    assert reward == pytest.approx({"firm_a": prices[0] * d, "firm_b": prices[1] * d})
+    assert list(obs["last_prices"]) == prices
+    assert not terminated
+
+
+def test_observations_not_aliased():
+    """Test that later steps never change an earlier observation."""
+    env = PriceGameEnv()
+    first, _ = env.reset()
+    second, *_ = env.step({"firm_a": 4, "firm_b": 5})
+    env.step({"firm_a": 8, "firm_b": 2})
+    assert list(first["last_prices"]) == [1, 1]
+    assert list(second["last_prices"]) == [5, 6]
+    with pytest.raises(ValueError):
+        second["last_prices"][0] = 3
@@ -0,0 +1,35 @@
+"""Tests for prompt template formatting"""
+from safety_governor.utils.prompt_templates import compile_prompt, format_prompt, get_prompt_template
+
+
+def test_format_price_game_prompt():
+    """Test that observation fields are mapped onto the price game template"""
+    template = get_prompt_template("price_game")
+    prompt = format_prompt(template, {"last_prices": [3, 8], "current_step": 2}, agent_index=1)
+    assert "Your last price: 8" in prompt
+    assert "Opponent's last price: 3" in prompt
+    assert "Round number: 2" in prompt
+    # last_profits is not part of the observation and falls back to the default
+    assert "Last round profits: [0, 0]" in prompt
+
+
+def test_format_prompt_extra_fields():
+    """Test that arbitrary observation keys can be used as placeholders"""
+    prompt = format_prompt("Budget {budget} in round {round_num}", {"budget": 7})
+    assert prompt == "Budget 7 in round 0"
+
+
+def test_format_prompt_unknown_placeholder():
+    """Test that placeholders without data or defaults produce an error string"""
+    prompt = format_prompt("Value: {not_a_field}", {})
+    assert prompt.startswith("Error formatting prompt")
+
+
+def test_compile_prompt():
+    """Test that compiled templates are cached and match format_prompt"""
+    template = "Prices {last_prices[0]}/{last_prices[1]}, mine {my_last_price}"
+    render = compile_prompt(template)
+    assert compile_prompt(template) is render
+    observation = {"last_prices": [4, 6], "unused": object()}
+    assert render(observation, 1) == "Prices 4/6, mine 6"
+    assert render(observation, 1) == format_prompt(template, observation, agent_index=1)
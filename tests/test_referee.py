@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""Tests for the collusion referee."""
+
+import pytest
+
+from safety_governor.referees.simple_collusion_referee import SimpleCollusionReferee
+from safety_governor.utils import event_bus
+
+
+@pytest.fixture
+def alerts():
+    """Collect alerts published on the event bus."""
+    received = []
+
+    def handler(event_type, payload):
+        received.append(payload)
+
+    event_bus.subscribe("alert", handler)
+    yield received
+    event_bus.unsubscribe("alert", handler)
+
+
+class TestSimpleCollusionReferee:
+    """Test the rolling-window collusion detection."""
+
+    def test_alert_after_full_window(self, alerts):
+        """Test an alert fires once the window is full of high prices."""
+        ref = SimpleCollusionReferee(threshold=8, window=3)
+        high = {'firm_a': 8, 'firm_b': 9}
+        assert ref.inspect(high) is False
+        assert ref.inspect(high) is False
+        assert ref.inspect(high) is True
+        assert len(alerts) == 1
+        assert alerts[0]['type'] == 'tacit_collusion'
+
+    def test_low_price_breaks_window(self, alerts):
+        """Test a single competitive step resets detection for a window."""
+        ref = SimpleCollusionReferee(threshold=8, window=3)
+        high = {'firm_a': 9, 'firm_b': 9}
+        low = {'firm_a': 9, 'firm_b': 2}
+        results = [ref.inspect(a) for a in [high, high, low, high, high, high]]
+        assert results == [False, False, False, False, False, True]
+        assert len(alerts) == 1
+
+    def test_threshold_offset(self):
+        """Test that actions are offset by one before comparing to the threshold."""
+        ref = SimpleCollusionReferee(threshold=8, window=1)
+        assert ref.inspect({'firm_a': 7, 'firm_b': 7}) is True
+        assert ref.inspect({'firm_a': 7, 'firm_b': 6}) is False
+
+    def test_reset_clears_window(self, alerts):
+        """Test that reset forgets the price history."""
+        ref = SimpleCollusionReferee(threshold=8, window=2)
+        high = {'firm_a': 9, 'firm_b': 9}
+        ref.inspect(high)
+        ref.reset()
+        assert ref.inspect(high) is False
+        assert ref.inspect(high) is True
+
+    def test_many_agents(self):
+        """Test the vectorized path used for large agent counts."""
+        ref = SimpleCollusionReferee(threshold=8, window=1)
+        actions = {f'firm_{i}': 9 for i in range(16)}
+        assert ref.inspect(actions) is True
+        actions['firm_3'] = 2
+        assert ref.inspect(actions) is False